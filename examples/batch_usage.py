@@ -0,0 +1,19 @@
+import numpy as np
+from methods.solver import solve_batch
+
+def main():
+    # Parameter sweep: x sin(x) = p_k for many p_k, all solved in lockstep
+    p = np.linspace(0.1, 1.5, 15)
+    f = lambda x: x * np.sin(x) - p
+    df = lambda x: np.sin(x) + x * np.cos(x)
+
+    result = solve_batch("newton", f, df=df, x0=np.ones_like(p))
+
+    print("\nFinal Result")
+    for pk, root, its in zip(p, result.root, result.iterations):
+        print(f"p = {pk:.2f}  root = {root:.10f}  iterations = {its}")
+    print("All converged:", result.converged.all())
+    print("Max |f(root)|:", np.max(np.abs(f(result.root))))
+
+if __name__ == "__main__":
+    main()
@@ -19,7 +19,58 @@ def J(v: np.ndarray) -> np.ndarray:
     ])
 
 
+def FJ(v: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # F and J from a single call (v is unpacked once for both)
+    x, y = v
+    fx = np.array([
+        x**2 + y**2 - 1.0,
+        x - y,
+    ])
+    jx = np.array([
+        [2.0*x, 2.0*y],
+        [1.0,   -1.0],
+    ])
+    return fx, jx
+
+
+def F_out(v: np.ndarray, out: np.ndarray) -> None:
+    # Out-parameter style (out_mode=True): fill a preallocated buffer,
+    # no new array per call
+    x, y = v
+    out[0] = x*x + y*y - 1.0
+    out[1] = x - y
+
+
+def J_out(v: np.ndarray, out: np.ndarray) -> None:
+    x, y = v
+    out[0, 0] = 2.0*x
+    out[0, 1] = 2.0*y
+    out[1, 0] = 1.0
+    out[1, 1] = -1.0
+
+
+def F_scalar(x: float, y: float) -> tuple[float, float]:
+    # backend="scalar": plain floats in and out, no NumPy for a 2-vector
+    return (x*x + y*y - 1.0, x - y)
+
+
+def J_scalar(x: float, y: float) -> tuple[tuple[float, float], tuple[float, float]]:
+    return ((2.0*x, 2.0*y), (1.0, -1.0))
+
+
 if __name__ == "__main__":
     res = newton_system(F, x0=[0.8, 0.6], jac=J)
     print(res)
+
+    # Same system with a fused F/J callback
+    res = newton_system(None, x0=[0.8, 0.6], fjac=FJ)
+    print(res)
+
+    # Same system writing into preallocated buffers
+    res = newton_system(F_out, x0=[0.8, 0.6], jac=J_out, out_mode=True)
+    print(res)
+
+    # Same system on Python floats
+    res = newton_system(F_scalar, x0=(0.8, 0.6), jac=J_scalar, backend="scalar")
+    print(res)
     # Expect root near [1/sqrt(2), 1/sqrt(2)] ~ [0.7071, 0.7071]
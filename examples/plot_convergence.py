@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 from methods.bisection import bisection_method
 from methods.newton import newton_method
@@ -23,10 +24,10 @@ def main() -> None:
     secant = secant_method(f, x0=1.0, x1=2.0)
     
     # Your result objects have a `history` attribute that contains the sequence of approximations.
-    newton_err = [abs(x - true_root) for x in newton.history]
-    bisect_err = [abs(x - true_root) for x in bisect.history]
-    brent_err = [abs(x - true_root) for x in brent.history]
-    secant_err = [abs(x - true_root) for x in secant.history]
+    newton_err = np.abs(newton.history - true_root)
+    bisect_err = np.abs(bisect.history - true_root)
+    brent_err = np.abs(brent.history - true_root)
+    secant_err = np.abs(secant.history - true_root)
 
     plt.figure()
     plt.semilogy(range(len(newton_err)), newton_err, marker="o", label="Newton")
@@ -0,0 +1,59 @@
+"""
+Ahead-of-time build of the polynomial Newton kernel (optional).
+
+    python -m methods._aot_build
+
+compiles poly_newton_f8 with numba.pycc into methods/_solver_aot.<platform>.so.
+When that module is importable, methods.poly.poly_newton calls it directly, so
+the first solve in a fresh process pays no JIT compilation. Without it,
+poly_newton generates and JIT-compiles a Horner kernel per polynomial, which
+costs compile time once per process and coefficient set. In return, the loop is
+specialised to the coefficients.
+
+The AOT kernel takes the coefficients as arrays, so one compiled object serves
+every polynomial. numba.pycc is deprecated upstream; the JIT path stays the
+default.
+"""
+from pathlib import Path
+
+from numba import njit
+from numba.pycc import CC
+
+cc = CC("_solver_aot")
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+
+@njit
+def _horner(c, x):
+    p = c[0]
+    for i in range(1, c.size):
+        p = p * x + c[i]
+    return p
+
+
+@cc.export("poly_newton_f8", "Tuple((f8, i8, b1))(f8[:], f8[:], f8, f8, i8, f8, f8[:])")
+def poly_newton_f8(c, dc, x, tol, max_iter, min_derivative, hist):
+    # methods.newton._newton_core with f, df evaluated from coefficient arrays
+    hist[0] = x
+    fx = _horner(c, x)
+
+    for k in range(1, max_iter + 1):
+        dfx = _horner(dc, x)
+
+        if abs(dfx) < min_derivative:
+            return x, k - 1, False
+
+        x_new = x - fx / dfx
+        hist[k] = x_new
+
+        fx_new = _horner(c, x_new)
+        if abs(fx_new) < tol or abs(x_new - x) < tol:
+            return x_new, k, True
+
+        x, fx = x_new, fx_new
+
+    return x, max_iter, False
+
+
+if __name__ == "__main__":
+    cc.compile()
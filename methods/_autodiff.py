@@ -0,0 +1,90 @@
+"""
+Derivatives for Newton's method when df is not supplied.
+
+JAX is not a required dependency and is only imported the first time a
+derivative has to be derived. Without it, or when f cannot be traced by JAX
+(e.g. it uses math.* functions), df falls back to a central difference.
+"""
+from __future__ import annotations
+
+import weakref
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+
+Func = Callable[[float], float]
+FusedFunc = Callable[[float], Tuple[float, float]]
+
+_MISSING = object()
+
+# Compiled (f, f') per user function, or None if f could not be traced. Keys
+# are weak and the compiled code only refers to f weakly, so f is not pinned.
+_JAX_CACHE: "weakref.WeakKeyDictionary[Func, Optional[FusedFunc]]" = weakref.WeakKeyDictionary()
+
+
+def _import_jax() -> Optional[Any]:
+    try:
+        import jax
+    except ImportError:  # pragma: no cover - depends on the environment
+        return None
+    return jax
+
+
+def _x64(jax: Any) -> Any:
+    # Context manager enabling float64; JAX defaults to float32
+    if hasattr(jax, "enable_x64"):
+        return jax.enable_x64(True)
+    from jax.experimental import enable_x64  # older JAX releases
+    return enable_x64()
+
+
+def _jax_f_and_df(jax: Any, f: Func) -> Optional[FusedFunc]:
+    # jit(value_and_grad(f)) compiled once for float64 scalars, or None if f
+    # cannot be traced
+    with _x64(jax):
+        try:
+            value_and_grad = jax.jit(jax.value_and_grad(f)).lower(np.float64(0.0)).compile()
+        except Exception:
+            return None
+
+    def f_and_df(x: float) -> Tuple[float, float]:
+        with _x64(jax):
+            fx, dfx = value_and_grad(np.float64(x))
+        return float(fx), float(dfx)
+
+    return f_and_df
+
+
+def _cached_jax_f_and_df(jax: Any, f: Func) -> Optional[FusedFunc]:
+    try:
+        f_and_df = _JAX_CACHE.get(f, _MISSING)
+    except TypeError:  # f cannot be weakly referenced
+        return _jax_f_and_df(jax, f)
+    if f_and_df is _MISSING:
+        f_ref = weakref.ref(f)
+        f_and_df = _JAX_CACHE[f] = _jax_f_and_df(jax, lambda x: f_ref()(x))
+    return f_and_df
+
+
+def make_f_and_df(f: Func, eps: float = 1e-6) -> FusedFunc:
+    """
+    Return x -> (f(x), f'(x)).
+
+    With JAX installed and f traceable (written with jax.numpy or plain
+    arithmetic) this is jax.jit(jax.value_and_grad(f)) evaluated in float64, so
+    f and f' share one compiled call. It is compiled once per f and reused by
+    later calls with the same f. Otherwise f' is a central difference with
+    step eps * (1 + |x|), costing two extra f evaluations.
+    """
+    jax = _import_jax()
+
+    if jax is not None:
+        f_and_df = _cached_jax_f_and_df(jax, f)
+        if f_and_df is not None:
+            return f_and_df
+
+    def f_and_df(x: float) -> Tuple[float, float]:
+        h = eps * (1.0 + abs(x))
+        return f(x), (f(x + h) - f(x - h)) / (2.0 * h)
+
+    return f_and_df
@@ -0,0 +1,161 @@
+"""
+ctypes bindings for the optional compiled kernels in _kernels.c.
+
+The shared library is not built automatically; see _kernels.c for the one-line
+build command. Without it HAVE_C_KERNELS is False and the solvers use their
+Numba or pure-Python kernels. Each binding has the same signature and return
+value as the matching Python core, except that f (and df) must be C-callable
+(see c_function).
+"""
+from __future__ import annotations
+
+import ctypes
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+_LIB_NAMES = ("_kernels.so", "_kernels.dylib", "_kernels.dll")
+
+
+def _load() -> Optional[ctypes.CDLL]:
+    here = Path(__file__).resolve().parent
+    for name in _LIB_NAMES:
+        path = here / name
+        if path.exists():
+            return ctypes.CDLL(str(path))
+    return None
+
+
+_lib = _load()
+HAVE_C_KERNELS = _lib is not None
+
+_double = ctypes.c_double
+_long = ctypes.c_long
+_hist = np.ctypeslib.ndpointer(dtype=np.float64, flags="C_CONTIGUOUS")
+
+if _lib is not None:
+    _lib.bisection_core.restype = ctypes.c_int
+    _lib.bisection_core.argtypes = [
+        ctypes.c_void_p, _double, _double, _double, _double, _double, _long, _hist,
+        ctypes.POINTER(_long), ctypes.POINTER(_double),
+    ]
+    _lib.newton_core.restype = ctypes.c_int
+    _lib.newton_core.argtypes = [
+        ctypes.c_void_p, ctypes.c_void_p, _double, _double, _long, _double, _hist,
+        ctypes.POINTER(_long), ctypes.POINTER(_double),
+    ]
+    _lib.secant_core.restype = ctypes.c_int
+    _lib.secant_core.argtypes = [
+        ctypes.c_void_p, _double, _double, _double, _long, _double, _hist,
+        ctypes.POINTER(_long), ctypes.POINTER(_double),
+    ]
+    _lib.brent_core.restype = ctypes.c_int
+    _lib.brent_core.argtypes = [
+        ctypes.c_void_p, _double, _double, _double, _double, _double, _long, _hist,
+        ctypes.POINTER(_long), ctypes.POINTER(_double),
+    ]
+
+
+_CFunc = ctypes.CFUNCTYPE(_double, _double)
+
+# Private prototypes: setting restype/argtypes on ctypes.pythonapi attributes
+# would change the shared function objects for every library in the process
+_capsule_name = ctypes.PYFUNCTYPE(ctypes.c_char_p, ctypes.py_object)(
+    ("PyCapsule_GetName", ctypes.pythonapi)
+)
+_capsule_pointer = ctypes.PYFUNCTYPE(ctypes.c_void_p, ctypes.py_object, ctypes.c_char_p)(
+    ("PyCapsule_GetPointer", ctypes.pythonapi)
+)
+
+
+def _low_level_callable_address(func: Any) -> Optional[int]:
+    # scipy.LowLevelCallable is a tuple (capsule, original object, user_data);
+    # checked by name so SciPy is never imported here
+    if type(func).__name__ != "LowLevelCallable" or not isinstance(func, tuple):
+        return None
+    if func.signature != "double (double)" or func.user_data is not None:
+        return None
+    capsule = tuple(func)[0]
+    return _capsule_pointer(capsule, _capsule_name(capsule))
+
+
+def c_function(func: Any) -> Optional[int]:
+    """
+    Address of func as a C ``double (*)(double)``, or None if it is not one.
+
+    Accepts ctypes function pointers (e.g. ``ctypes.CFUNCTYPE(c_double, c_double)``
+    instances or functions from a loaded C library with matching restype/argtypes),
+    Numba ``@cfunc("float64(float64)")`` objects and ``scipy.LowLevelCallable``
+    with signature ``double (double)``.
+    """
+    address = _low_level_callable_address(func)
+    if address is not None:
+        return address
+
+    ptr = func if isinstance(func, ctypes._CFuncPtr) else getattr(func, "ctypes", None)
+    if not isinstance(ptr, ctypes._CFuncPtr):
+        return None
+    if ptr.restype is not _double or tuple(ptr.argtypes or ()) != (_double,):
+        return None
+    return ctypes.cast(ptr, ctypes.c_void_p).value
+
+
+def as_c_function(func: Any) -> Optional[ctypes._CFuncPtr]:
+    """
+    func as a ctypes ``double (*)(double)`` that is callable from both Python and C,
+    or None if func is not C-callable (see c_function).
+
+    The result does not own the machine code: keep func alive while it is used.
+    """
+    if isinstance(func, ctypes._CFuncPtr) and c_function(func) is not None:
+        return func
+    address = c_function(func)
+    return None if address is None else _CFunc(address)
+
+
+def use_c_kernels(*funcs: Any) -> bool:
+    """
+    True if the C kernels are built and every function is C-callable.
+    """
+    return HAVE_C_KERNELS and all(c_function(func) is not None for func in funcs)
+
+
+def bisection_core(f, left, right, fleft, tol, residual_tol, max_iter, hist):
+    iterations = _long()
+    out = (_double * 3)()
+    converged = _lib.bisection_core(
+        c_function(f), left, right, fleft, tol, residual_tol, max_iter, hist,
+        ctypes.byref(iterations), out,
+    )
+    return out[0], iterations.value, bool(converged), out[1], out[2]
+
+
+def newton_core(f, df, x, tol, max_iter, min_derivative, hist):
+    iterations = _long()
+    root = _double()
+    converged = _lib.newton_core(
+        c_function(f), c_function(df), x, tol, max_iter, min_derivative, hist,
+        ctypes.byref(iterations), ctypes.byref(root),
+    )
+    return root.value, iterations.value, bool(converged)
+
+
+def secant_core(f, x0, x1, tol, max_iter, min_denom, hist):
+    iterations = _long()
+    root = _double()
+    converged = _lib.secant_core(
+        c_function(f), x0, x1, tol, max_iter, min_denom, hist,
+        ctypes.byref(iterations), ctypes.byref(root),
+    )
+    return root.value, iterations.value, bool(converged)
+
+
+def brent_core(f, a, b, fa, fb, tol, max_iter, hist):
+    iterations = _long()
+    out = (_double * 3)()
+    converged = _lib.brent_core(
+        c_function(f), a, b, fa, fb, tol, max_iter, hist,
+        ctypes.byref(iterations), out,
+    )
+    return out[0], iterations.value, bool(converged), out[1], out[2]
@@ -0,0 +1,65 @@
+"""
+Optional Numba support for the scalar kernels.
+
+Numba is not a required dependency. When it is missing, ``njit`` is a no-op
+decorator and every kernel runs as plain Python.
+
+The kernels take f (and df) as arguments, so Numba compiles one specialisation
+per user function. They are not cached on disk: the cache index would pickle
+each user function's type, and loading it from a process that cannot import
+that function's module fails. To reuse compiled code across calls, pass
+``@njit`` functions; their dispatchers keep every specialisation they compiled.
+"""
+from __future__ import annotations
+
+import inspect
+from typing import Any, Callable, Optional
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - depends on the environment
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+# Raised by Numba when it cannot type or compile a function (nothing without Numba)
+NUMBA_ERRORS: tuple = (numba.core.errors.NumbaError,) if numba is not None else ()
+
+
+def njit(*args: Any, **kwargs: Any) -> Callable:
+    """
+    ``numba.njit`` if Numba is installed, otherwise a decorator returning the function unchanged.
+    """
+    if numba is not None:
+        return numba.njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable) -> Callable:
+        return func
+
+    return decorator
+
+
+def is_jitted(*funcs: Callable) -> bool:
+    """
+    True if every function is a Numba ``@njit`` dispatcher (and can be called from a kernel).
+    """
+    if numba is None:
+        return False
+    return all(isinstance(func, numba.core.registry.CPUDispatcher) for func in funcs)
+
+
+def as_jitted(func: Optional[Callable]) -> Optional[Callable]:
+    """
+    Compile a plain Python function with ``numba.njit`` so it can be passed to a kernel.
+
+    Numba dispatchers, non-Python callables (e.g. ctypes pointers) and None are
+    returned unchanged, as is everything when Numba is not installed. A plain
+    function gets a fresh dispatcher on every call: Numba freezes globals at
+    compile time, so a cached one would keep using stale global values.
+    """
+    if numba is None or not inspect.isfunction(func):
+        return func
+    return numba.njit(func)
@@ -0,0 +1,225 @@
+/*
+ * Optional compiled scalar kernels.
+ *
+ * Each function is a line-by-line port of the matching _<method>_core loop in
+ * methods/<method>.py and takes f (and df) as C function pointers, so a solve
+ * runs without returning to Python. Loaded through ctypes by methods/_ckernels.py
+ * when the shared library has been built:
+ *
+ *     cc -O3 -march=native -ffp-contract=off -shared -fPIC methods/_kernels.c -o methods/_kernels.so
+ *
+ * -ffp-contract=off keeps results bit-identical to the Python kernels (no FMA
+ * contraction). Results other than the return flag are written through pointers.
+ */
+#include <math.h>
+
+typedef double (*func_t)(double);
+
+/* out = {root, left, right}; returns converged */
+int bisection_core(func_t f, double left, double right, double fleft, double tol,
+                   double residual_tol, long max_iter, double *hist,
+                   long *iterations, double *out)
+{
+    double root = left;
+    int converged = 0;
+    long k;
+
+    for (k = 1; k <= max_iter; ++k) {
+        double half = 0.5 * (right - left);
+        double fm;
+
+        root = left + half;
+        hist[k - 1] = root;
+
+        fm = f(root);
+
+        if (half <= tol || fabs(fm) <= residual_tol) {
+            converged = 1;
+            break;
+        }
+
+        if (fm * fleft < 0) {
+            right = root;
+        } else {
+            left = root;
+            fleft = fm;
+        }
+    }
+
+    *iterations = converged ? k : max_iter;
+    out[0] = root;
+    out[1] = left;
+    out[2] = right;
+    return converged;
+}
+
+/* hist holds iterations + 1 values; returns converged */
+int newton_core(func_t f, func_t df, double x, double tol, long max_iter,
+                double min_derivative, double *hist, long *iterations, double *root)
+{
+    double fx;
+    long k;
+
+    hist[0] = x;
+    fx = f(x);
+
+    for (k = 1; k <= max_iter; ++k) {
+        double dfx = df(x);
+        double x_new, fx_new;
+
+        if (fabs(dfx) < min_derivative) {
+            *iterations = k - 1;
+            *root = x;
+            return 0;
+        }
+
+        x_new = x - fx / dfx;
+        hist[k] = x_new;
+
+        fx_new = f(x_new);
+        if (fabs(fx_new) < tol || fabs(x_new - x) < tol) {
+            *iterations = k;
+            *root = x_new;
+            return 1;
+        }
+
+        x = x_new;
+        fx = fx_new;
+    }
+
+    *iterations = max_iter;
+    *root = x;
+    return 0;
+}
+
+/* hist holds iterations + 2 values; returns converged */
+int secant_core(func_t f, double x0, double x1, double tol, long max_iter,
+                double min_denom, double *hist, long *iterations, double *root)
+{
+    double fx0 = f(x0);
+    double fx1 = f(x1);
+    long k;
+
+    hist[0] = x0;
+    hist[1] = x1;
+
+    /* An exact zero is a root even when f(x1) - f(x0) is too small to divide by */
+    if (fx1 == 0.0 || fx0 == 0.0) {
+        *iterations = 0;
+        *root = fx1 == 0.0 ? x1 : x0;
+        return 1;
+    }
+
+    for (k = 1; k <= max_iter; ++k) {
+        double denom = fx1 - fx0;
+        double x2;
+
+        if (fabs(denom) < min_denom) {
+            *iterations = k - 1;
+            *root = x1;
+            return 0;
+        }
+
+        x2 = x1 - fx1 * (x1 - x0) / denom;
+        hist[k + 1] = x2;
+
+        if (fabs(x2 - x1) <= tol) {
+            *iterations = k;
+            *root = x2;
+            return 1;
+        }
+
+        x0 = x1;
+        x1 = x2;
+        fx0 = fx1;
+        fx1 = f(x1);
+
+        if (fabs(fx1) < tol) {
+            *iterations = k;
+            *root = x1;
+            return 1;
+        }
+    }
+
+    *iterations = max_iter;
+    *root = x1;
+    return 0;
+}
+
+/* out = {root, a, b}; returns converged */
+int brent_core(func_t f, double a, double b, double fa, double fb, double tol,
+               long max_iter, double *hist, long *iterations, double *out)
+{
+    double c, fc, s, d = 0.0, t;
+    int mflag = 1, d_initialized = 0, converged = 0;
+    long k;
+
+    if (fabs(fa) < fabs(fb)) {
+        t = a; a = b; b = t;
+        t = fa; fa = fb; fb = t;
+    }
+
+    c = a;
+    fc = fa;
+    s = b;
+
+    for (k = 1; k <= max_iter; ++k) {
+        double fs, q;
+        int condition1, condition2, condition3, condition4, condition5, keep_a;
+
+        if (fa != fc && fb != fc) {
+            /* Inverse quadratic interpolation */
+            double dab = fa - fb;
+            double dac = fa - fc;
+            double dbc = fb - fc;
+            s = (a * fb * fc) / (dab * dac) - (b * fa * fc) / (dab * dbc) + (c * fa * fb) / (dac * dbc);
+        } else {
+            /* Secant method */
+            s = b - fb * (b - a) / (fb - fa);
+        }
+
+        q = (3 * a + b) / 4;
+        condition1 = (b > a) ? !(q < s && s < b) : !(b < s && s < q);
+        condition2 = mflag && fabs(s - b) >= fabs(b - c) / 2;
+        condition3 = d_initialized && !mflag && fabs(s - b) >= fabs(c - d) / 2;
+        condition4 = mflag && fabs(b - c) < tol;
+        condition5 = d_initialized && !mflag && fabs(c - d) < tol;
+
+        if (condition1 || condition2 || condition3 || condition4 || condition5) {
+            s = (a + b) / 2;
+            mflag = 1;
+        } else {
+            mflag = 0;
+        }
+
+        fs = f(s);
+        hist[k - 1] = s;
+
+        d = c;
+        d_initialized = 1;
+        c = b;
+        fc = fb;
+
+        keep_a = fa * fs < 0;
+        b = keep_a ? s : b;
+        fb = keep_a ? fs : fb;
+        a = keep_a ? a : s;
+        fa = keep_a ? fa : fs;
+
+        if (fabs(fa) < fabs(fb)) {
+            t = a; a = b; b = t;
+            t = fa; fa = fb; fb = t;
+        }
+
+        if (fabs(fb) < tol) {
+            converged = 1;
+            break;
+        }
+    }
+
+    *iterations = converged ? k : max_iter;
+    out[0] = b;
+    out[1] = a;
+    out[2] = b;
+    return converged;
+}
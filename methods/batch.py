@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+Array = np.ndarray
+VecFunc = Callable[[Array], Array]
+
+@dataclass(frozen=True, slots=True)
+class RootResult:
+    """
+    Outcome of one scalar problem: root, convergence flag and work done.
+
+    function_calls counts every call of f and df the problem needed.
+    """
+    root: float
+    converged: bool
+    iterations: int
+    function_calls: int
+
+@dataclass(frozen=True, slots=True)
+class BatchRootResult:
+    """
+    Outcomes of N scalar problems as arrays of length N (see RootResult).
+
+    Indexing gives the RootResult of one problem, for loop-style consumers;
+    reductions such as result.root.mean() work on the arrays directly.
+    """
+    root: Array
+    iterations: Array
+    converged: Array
+    function_calls: Array
+
+    def __len__(self) -> int:
+        return self.root.size
+
+    def __getitem__(self, i: int) -> RootResult:
+        return RootResult(
+            root=float(self.root[i]),
+            converged=bool(self.converged[i]),
+            iterations=int(self.iterations[i]),
+            function_calls=int(self.function_calls[i]),
+        )
+
+def _as_float_batch(x, name: str) -> Array:
+    arr = np.array(x, dtype=float).reshape(-1)
+    if arr.size == 0:
+        raise ValueError(f"{name} must be a non-empty 1-D array.")
+    return arr
+
+def bisection_batch(
+    f_vec: VecFunc,
+    a,
+    b,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+    residual_tol: Optional[float] = None,
+) -> BatchRootResult:
+    """
+    Vectorized bisection: solve f(x) = 0 on N brackets [a_i, b_i] at once.
+
+    f_vec must map a 1-D array to a 1-D array and is evaluated once per
+    iteration on the whole batch. Each problem follows the same stopping
+    rule as bisection_method (including residual_tol) and stops updating
+    once it has converged.
+
+    Requirements
+    - f(a_i) and f(b_i) must have opposite signs for every i.
+    """
+    left = _as_float_batch(a, "a")
+    right = _as_float_batch(b, "b")
+    if left.shape != right.shape:
+        raise ValueError("a and b must have the same length.")
+
+    # State arrays are owned copies and updated in place
+    fleft = np.array(f_vec(left), dtype=float)
+    fright = np.asarray(f_vec(right), dtype=float)
+
+    if residual_tol is None:
+        residual_tol = 0.0
+    if np.any(fleft * fright > 0):
+        raise ValueError("Bisection method requires f(a) and f(b) to have opposite signs (root must be bracketed)")
+
+    # Problems with a root exactly at an endpoint are done before the loop
+    root = np.where(fleft == 0.0, left, right)
+    converged = (fleft == 0.0) | (fright == 0.0)
+    active = ~converged
+    iterations = np.zeros(left.shape, dtype=int)
+    function_calls = np.full(left.shape, 2)
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+
+        half = 0.5 * (right - left)
+        mid = left + half
+        fm = np.asarray(f_vec(mid), dtype=float)
+
+        np.copyto(root, mid, where=active)
+        iterations += active
+        function_calls += active
+
+        # Stop Conditions
+        done = active & ((half <= tol) | (np.abs(fm) <= residual_tol))
+        converged |= done
+        active &= ~done
+
+        # Keep the subinterval that contains the root
+        lower = fm * fleft < 0
+        move_right = active & lower
+        move_left = active & ~lower
+        np.copyto(right, mid, where=move_right)
+        np.copyto(left, mid, where=move_left)
+        np.copyto(fleft, fm, where=move_left)
+
+    return BatchRootResult(root=root, iterations=iterations, converged=converged, function_calls=function_calls)
+
+def newton_batch(
+    f_vec: VecFunc,
+    df_vec: VecFunc,
+    x0,
+    tol: float = 1e-8,
+    max_iter: int = 50,
+    min_derivative: float = 1e-12,
+) -> BatchRootResult:
+    """
+    Vectorized Newton-Raphson: solve f(x) = 0 from N initial guesses at once.
+
+    f_vec and df_vec are evaluated once per iteration on the whole batch.
+    A boolean mask tracks which problems are still iterating; finished
+    problems (converged, or stopped on a derivative below min_derivative)
+    are frozen and no longer updated.
+    """
+    x = _as_float_batch(x0, "x0")
+    fx = np.asarray(f_vec(x), dtype=float)
+    converged = np.zeros(x.shape, dtype=bool)
+    active = np.ones(x.shape, dtype=bool)
+    iterations = np.zeros(x.shape, dtype=int)
+    function_calls = np.ones(x.shape, dtype=int)
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+
+        dfx = np.asarray(df_vec(x), dtype=float)
+        function_calls += active
+
+        active &= np.abs(dfx) >= min_derivative
+        step = np.divide(fx, dfx, out=np.zeros_like(x), where=active)
+
+        x_new = x - step
+        iterations += active
+        function_calls += active
+        fx_new = np.asarray(f_vec(x_new), dtype=float)
+
+        done = active & ((np.abs(fx_new) < tol) | (np.abs(x_new - x) < tol))
+        converged |= done
+        active &= ~done
+        x, fx = x_new, fx_new
+
+    return BatchRootResult(root=x, iterations=iterations, converged=converged, function_calls=function_calls)
+
+def secant_batch(
+    f_vec: VecFunc,
+    x0,
+    x1,
+    tol: float = 1e-8,
+    max_iter: int = 50,
+    min_denom: float = 1e-14,
+) -> BatchRootResult:
+    """
+    Vectorized secant method: solve f(x) = 0 from N pairs of initial guesses at once.
+
+    f_vec is evaluated once per iteration on the whole batch. Problems
+    that have converged, or whose |f(x1) - f(x0)| fell below min_denom,
+    are frozen and no longer updated.
+    """
+    x0 = _as_float_batch(x0, "x0")
+    x1 = _as_float_batch(x1, "x1")
+    if x0.shape != x1.shape:
+        raise ValueError("x0 and x1 must have the same length.")
+
+    # State arrays are owned copies and updated in place
+    fx0 = np.array(f_vec(x0), dtype=float)
+    fx1 = np.array(f_vec(x1), dtype=float)
+
+    # An exact zero at either guess is a root, as in secant_method
+    x1 = np.where((fx1 != 0.0) & (fx0 == 0.0), x0, x1)
+    converged = (fx1 == 0.0) | (fx0 == 0.0)
+    active = ~converged
+    iterations = np.zeros(x1.shape, dtype=int)
+    function_calls = np.full(x1.shape, 2)
+
+    for _ in range(max_iter):
+        denom = fx1 - fx0
+        active &= np.abs(denom) >= min_denom
+        if not active.any():
+            break
+
+        stepping = active.copy()
+        step = np.divide(fx1 * (x1 - x0), denom, out=np.zeros_like(x1), where=stepping)
+        x2 = x1 - step
+        iterations += stepping
+
+        done = stepping & (np.abs(x2 - x1) <= tol)
+        converged |= done
+        active &= ~done
+
+        # Frozen problems have step == 0, so x2 already holds their root
+        np.copyto(x0, x1, where=stepping)
+        x1 = x2
+        if not active.any():
+            break
+
+        np.copyto(fx0, fx1, where=active)
+        np.copyto(fx1, np.asarray(f_vec(x1), dtype=float), where=active)
+        function_calls += active
+
+        done = active & (np.abs(fx1) < tol)
+        converged |= done
+        active &= ~done
+
+    return BatchRootResult(root=x1, iterations=iterations, converged=converged, function_calls=function_calls)
@@ -1,19 +1,56 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, List
+from typing import Callable, Optional
+
+import numpy as np
+
+from methods._ckernels import bisection_core as _bisection_core_c, use_c_kernels
+from methods._jit import is_jitted, njit
 
 Number = float
 Func = Callable[[Number], Number]
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class BisectionResult:
     root: float
     iterations: int
     converged: bool
-    history: List[float]
+    history: np.ndarray
     a_final: float
     b_final: float
+    function_calls: int
+
+def _bisection_core(f, left, right, fleft, tol, residual_tol, max_iter, hist):
+    """
+    Bisection loop on a valid bracket. Writes the midpoints into ``hist``.
+
+    Returns (root, iterations, converged, left, right).
+    """
+    root = left  # only returned as-is when max_iter < 1
+
+    for k in range(1, max_iter + 1):
+        # left + half does not overflow for large |left|, |right| (unlike left + right)
+        half = 0.5 * (right - left)
+        root = left + half
+        hist[k - 1] = root
+
+        fm = f(root)
+
+        # Stop Conditions (residual_tol = 0 still stops on an exact root)
+        if half <= tol or abs(fm) <= residual_tol:
+            return root, k, True, left, right
+
+        # Keep the subinterval that contains the root
+        if fm * fleft < 0:
+            right = root
+        else:
+            left = root
+            fleft = fm
+
+    return root, max_iter, False, left, right
+
+_bisection_core_jit = njit(_bisection_core)
 
 def bisection_method(
     f: Func,
@@ -21,44 +58,41 @@ def bisection_method(
     b: float,
     tol: float = 1e-8,
     max_iter: int = 100,
+    residual_tol: Optional[float] = None,
 ) -> BisectionResult:
     """ 
     Find a root of f(x) = 0 on [a,b] using the bisection method.  
 
     Requirements
     - f(a) and f(b) must have opposite signs (i.e. bracket a root).
+
+    Stops once the half-width of the bracket is <= tol. If residual_tol is
+    given, it also stops as soon as |f(midpoint)| <= residual_tol.
     """
     fa = f(a)
     fb = f(b)
 
     if fa == 0.0:
-        return BisectionResult(root=a, iterations=0, converged=True, history=[a], a_final=a, b_final=a)
+        return BisectionResult(root=a, iterations=0, converged=True, history=np.array([a], dtype=np.float64), a_final=a, b_final=a, function_calls=2)
     if fb == 0.0:
-        return BisectionResult(root=b, iterations=0, converged=True, history=[b], a_final=b, b_final=b)
+        return BisectionResult(root=b, iterations=0, converged=True, history=np.array([b], dtype=np.float64), a_final=b, b_final=b, function_calls=2)
     if fa * fb > 0:
         raise ValueError("Bisection method requires f(a) and f(b) to have opposite signs (root must be bracketed)")
 
-    history: List[float] = []
-    left, right = a, b
-    fleft, fright = fa, fb
-    root = (left + right) / 2.0
-    
-    for k in range(1, max_iter + 1):
-        root = (left + right) / 2.0
-        history.append(root)
-
-        fm = f(root)
-
-        # Stop Conditions
-        if abs(fm) <= tol or (right - left) / 2.0 <= tol:
-            return BisectionResult(root=root, iterations=k, converged=True, history=history, a_final=left, b_final=right)
-        
-        # Keep the subinterval that contains the root
-        if fm * fleft < 0:
-            right = root
-            fright = fm
-        else:
-            left = root
-            fleft = fm
+    hist = np.empty(max_iter, dtype=np.float64)
+    if use_c_kernels(f):
+        core = _bisection_core_c
+    elif is_jitted(f):
+        core = _bisection_core_jit
+    else:
+        core = _bisection_core
+    root, k, converged, left, right = core(
+        f, float(a), float(b), float(fa), float(tol),
+        0.0 if residual_tol is None else float(residual_tol), int(max_iter), hist,
+    )
 
-    return BisectionResult(root=root, iterations=max_iter, converged=False, history=history, a_final=left, b_final=right)
\ No newline at end of file
+    # f(a) and f(b) once, then one midpoint evaluation per iteration
+    return BisectionResult(
+        root=root, iterations=k, converged=converged, history=hist[:k], a_final=left, b_final=right,
+        function_calls=k + 2,
+    )
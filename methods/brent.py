@@ -1,36 +1,26 @@
 from dataclasses import dataclass
-from typing import Callable, List
+from typing import Callable
 
-@dataclass
+import numpy as np
+
+from methods._ckernels import brent_core as _brent_core_c, use_c_kernels
+from methods._jit import is_jitted, njit
+
+@dataclass(slots=True)
 class BrentResult:
     root: float
     iterations: int
     converged: bool
-    history: List[float]
+    history: np.ndarray
     a_final: float
     b_final: float
 
-def brent_method(
-    f: Callable[[float], float],
-    a: float,
-    b: float,
-    tol: float = 1e-8,
-    max_iter: int = 100,
-) -> BrentResult:
-    """ 
-    Find a root of f(x) = 0 on [a,b] using Brent's method.  
-
-    Requirements
-    - f(a) and f(b) must have opposite signs (i.e. bracket a root).
+def _brent_core(f, a, b, fa, fb, tol, max_iter, hist):
     """
-    fa = f(a)
-    fb = f(b)
-
-    fa = f(a)
-    fb = f(b)
-    if fa * fb > 0:
-        raise ValueError("Brent's method requires f(a) and f(b) to have opposite signs (root must be bracketed)")
+    Brent iteration on a valid bracket. Writes the new iterates into ``hist``.
 
+    Returns (root, iterations, converged, a, b).
+    """
     if abs(fa) < abs(fb):
         a, b = b, a
         fa, fb = fb, fa
@@ -38,24 +28,27 @@ def brent_method(
     c = a
     fc = fa
 
-    history = []
-
     mflag = True
     s = b
+    d = 0.0
+    d_initialized = False
     
     for iteration in range(1, max_iter + 1):
         if fa != fc and fb != fc:
-            # Inverse quadratic interpolation
-            s = (a * fb * fc) / ((fa - fb) * (fa - fc)) + (b * fa * fc) / ((fb - fa) * (fb - fc)) + (c * fa * fb) / ((fc - fa) * (fc - fb))
+            # Inverse quadratic interpolation (fb - fa = -dab, fc - fa = -dac, fc - fb = -dbc)
+            dab = fa - fb
+            dac = fa - fc
+            dbc = fb - fc
+            s = (a * fb * fc) / (dab * dac) - (b * fa * fc) / (dab * dbc) + (c * fa * fb) / (dac * dbc)
         else:
             # Secant method
             s = b - fb * (b - a) / (fb - fa)
 
         condition1 = not ((3 * a + b) / 4 < s < b) if b > a else not (b < s < (3 * a + b) / 4)
         condition2 = mflag and abs(s - b) >= abs(b - c) / 2
-        condition3 = not mflag and abs(s - b) >= abs(c - d) / 2 if 'd' in locals() else False
+        condition3 = d_initialized and not mflag and abs(s - b) >= abs(c - d) / 2
         condition4 = mflag and abs(b - c) < tol
-        condition5 = not mflag and abs(c - d) < tol if 'd' in locals() else False
+        condition5 = d_initialized and not mflag and abs(c - d) < tol
 
         if condition1 or condition2 or condition3 or condition4 or condition5:
             s = (a + b) / 2
@@ -64,24 +57,61 @@ def brent_method(
             mflag = False
 
         fs = f(s)
-        history.append(s)
+        hist[iteration - 1] = s
 
         d = c
+        d_initialized = True
         c = b
         fc = fb
 
-        if (fa * fs < 0):
-            b = s
-            fb = fs
-        else:
-            a = s
-            fa = fs
-        
-        if abs(fa) < abs(fb):
-            a, b = b, a
-            fa, fb = fb, fa
+        # Keep the sign change in [a, b]. Written as selects rather than an
+        # if/else so the compiled kernel gets conditional moves, not branches.
+        keep_a = fa * fs < 0
+        b = s if keep_a else b
+        fb = fs if keep_a else fb
+        a = a if keep_a else s
+        fa = fa if keep_a else fs
+
+        # b is the best estimate so far
+        swap = abs(fa) < abs(fb)
+        a, b = (b, a) if swap else (a, b)
+        fa, fb = (fb, fa) if swap else (fa, fb)
 
         if abs(fb) < tol:
-            return BrentResult(root=b, iterations=iteration, converged=True, history=history, a_final=a, b_final=b)
+            return b, iteration, True, a, b
         
-    return BrentResult(root=b, iterations=max_iter, converged=False, history=history, a_final=a, b_final=b)
\ No newline at end of file
+    return b, max_iter, False, a, b
+
+_brent_core_jit = njit(_brent_core)
+
+def brent_method(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+) -> BrentResult:
+    """ 
+    Find a root of f(x) = 0 on [a,b] using Brent's method.  
+
+    Requirements
+    - f(a) and f(b) must have opposite signs (i.e. bracket a root).
+    """
+    fa = f(a)
+    fb = f(b)
+
+    if fa * fb > 0:
+        raise ValueError("Brent's method requires f(a) and f(b) to have opposite signs (root must be bracketed)")
+
+    hist = np.empty(max_iter, dtype=np.float64)
+    if use_c_kernels(f):
+        core = _brent_core_c
+    elif is_jitted(f):
+        core = _brent_core_jit
+    else:
+        core = _brent_core
+    root, k, converged, a, b = core(
+        f, float(a), float(b), float(fa), float(fb), float(tol), int(max_iter), hist
+    )
+
+    return BrentResult(root=root, iterations=k, converged=converged, history=hist[:k], a_final=a, b_final=b)
@@ -1,27 +1,22 @@
-import math 
-from typing import List
+from typing import Sequence
 
-def estimate_order(errors: List[float], eps: float = 1e-14) -> float:
+import numpy as np
+
+def estimate_order(errors: Sequence[float], eps: float = 1e-14) -> float:
     """ Estimate the order of convergence using classical 3-point formula. p = log(|e_{n+1}|/|e_n|) / log(|e_n|/|e_{n-1}|) """
-    e = [x for x in errors if x > eps]
+    e = np.asarray(errors, dtype=float)
+    e = e[e > eps]
 
-    if len(e) < 3:
+    if e.size < 3:
         raise ValueError("Need at least 3 non-zero error values above the threshold to estimate order.")
-    
-    p_vals = []
-    for i in range(2, len(e)):
-        e_nm1, e_n, e_np1 = e[i-2], e[i-1], e[i]
-        if e_n == 0 or e_nm1 == 0 or e_np1 == 0:
-            continue
-        denom = math.log(e_n / e_nm1)
-        if denom == 0:
-            continue
-        p = math.log(e_np1 / e_n) / denom
-        if math.isfinite(p):
-            p_vals.append(p)
 
-    if not p_vals:
+    # dlog[i] = log(e_{i+1} / e_i); a zero denominator gives inf/nan and is dropped
+    dlog = np.diff(np.log(e))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p_vals = dlog[1:] / dlog[:-1]
+    p_vals = p_vals[np.isfinite(p_vals)]
+
+    if p_vals.size == 0:
         raise ValueError("Could not compute any valid order estimates from the error data.")
-    
-    p_vals.sort()
-    return p_vals[len(p_vals) // 2]  # Return median to reduce sensitivity to outliers
\ No newline at end of file
+
+    return float(np.median(p_vals))  # Median reduces sensitivity to outliers
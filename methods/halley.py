@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+from methods._jit import is_jitted, njit
+from methods.newton import NewtonResult
+
+Number = float
+Func = Callable[[Number], Number]
+
+def _halley_core(f, df, d2f, x, tol, max_iter, min_denom, hist):
+    """
+    Halley loop. Same layout and return value as methods.newton._newton_core.
+    """
+    hist[0] = x
+    fx = f(x)
+
+    for k in range(1, max_iter + 1):
+        dfx = df(x)
+        d2fx = d2f(x)
+
+        denom = 2.0 * dfx * dfx - fx * d2fx
+        if abs(denom) < min_denom:
+            return x, k - 1, False
+
+        x_new = x - 2.0 * fx * dfx / denom
+        hist[k] = x_new
+
+        fx_new = f(x_new)
+        if abs(fx_new) < tol or abs(x_new - x) < tol:
+            return x_new, k, True
+
+        x, fx = x_new, fx_new
+
+    return x, max_iter, False
+
+_halley_core_jit = njit(_halley_core)
+
+def halley_method(
+    f: Func,
+    df: Func,
+    d2f: Func,
+    x0: float,
+    tol: float = 1e-8,
+    max_iter: int = 50,
+    min_denom: float = 1e-12,
+) -> NewtonResult:
+    """
+    Solve f(x) = 0 using Halley's method (cubic convergence).
+
+    x_{n+1} = x_n - 2 f f' / (2 f'^2 - f f''), with f, f', f'' at x_n.
+    Stops when either |x_{n+1} - x_n| < tol or |f(x_{n+1})| < tol, and gives up
+    if |2 f'^2 - f f''| falls below min_denom.
+    """
+    x = float(x0)
+    hist = np.empty(max_iter + 1, dtype=np.float64)
+
+    core = _halley_core_jit if is_jitted(f, df, d2f) else _halley_core
+    root, k, converged = core(f, df, d2f, x, float(tol), int(max_iter), float(min_denom), hist)
+
+    return NewtonResult(root, k, converged, hist[:k + 1])
@@ -1,44 +1,206 @@
-
 from dataclasses import dataclass
-from typing import Callable, List
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from methods._autodiff import make_f_and_df
+from methods._ckernels import newton_core as _newton_core_c, use_c_kernels
+from methods._jit import is_jitted, njit
 
 Number = float
 Func = Callable[[Number], Number]
+FusedFunc = Callable[[Number], Tuple[Number, Number]]
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class NewtonResult:
     root: float
     iterations: int
     converged: bool
-    history: List[float]
+    history: np.ndarray
+
+def _newton_core(f, df, x, tol, max_iter, min_derivative, hist):
+    """
+    Newton-Raphson loop. Writes x_0, x_1, ... into ``hist``.
+
+    Returns (root, iterations, converged); ``hist`` holds iterations + 1 values.
+    """
+    hist[0] = x
+    fx = f(x)
+
+    for k in range(1, max_iter + 1):
+        dfx = df(x)
+
+        if abs(dfx) < min_derivative: 
+            return x, k - 1, False
+
+        x_new = x - fx / dfx
+        hist[k] = x_new
+
+        # f(x_new) serves both the residual test and the next step
+        fx_new = f(x_new)
+        if abs(fx_new) < tol or abs(x_new - x) < tol:
+            return x_new, k, True
+
+        x, fx = x_new, fx_new
+
+    return x, max_iter, False
+
+_newton_core_jit = njit(_newton_core)
+
+def _newton_fused_core(f_and_df, x, tol, max_iter, min_derivative, hist):
+    """
+    Newton-Raphson loop with f(x) and f'(x) from one call. Same iterates and
+    return value as _newton_core.
+    """
+    hist[0] = x
+    fx, dfx = f_and_df(x)
+
+    for k in range(1, max_iter + 1):
+        if abs(dfx) < min_derivative:
+            return x, k - 1, False
+
+        x_new = x - fx / dfx
+        hist[k] = x_new
+
+        fx_new, dfx_new = f_and_df(x_new)
+        if abs(fx_new) < tol or abs(x_new - x) < tol:
+            return x_new, k, True
+
+        x, fx, dfx = x_new, fx_new, dfx_new
+
+    return x, max_iter, False
+
+_newton_fused_core_jit = njit(_newton_fused_core)
 
 def newton_method(
     f: Func,
-    df: Func,
+    df: Optional[Func],
     x0: float,
     tol: float = 1e-8,
     max_iter: int = 50,
     min_derivative: float = 1e-12,
+    f_and_df: Optional[FusedFunc] = None,
 ) -> NewtonResult:
     """ 
     Solve f(x) = 0 using the Newton-Raphson method. 
+
+    Stops when either |x_{n+1} - x_n| < tol or |f(x_{n+1})| < tol.
+
+    f_and_df, if given, returns (f(x), f'(x)) in one call and is used instead of
+    f and df, so work shared by both is done once per iterate. If df and f_and_df
+    are both None the derivative is derived automatically (JAX if installed,
+    otherwise central differences; see methods._autodiff.make_f_and_df).
     """
     x = float(x0)
-    history: List[float] = [x]
+    hist = np.empty(max_iter + 1, dtype=np.float64)
+
+    if f_and_df is None and df is None:
+        f_and_df = make_f_and_df(f)
+
+    if f_and_df is not None:
+        core = _newton_fused_core_jit if is_jitted(f_and_df) else _newton_fused_core
+        root, k, converged = core(f_and_df, x, float(tol), int(max_iter), float(min_derivative), hist)
+        return NewtonResult(root, k, converged, hist[:k + 1])
+
+    if use_c_kernels(f, df):
+        core = _newton_core_c
+    elif is_jitted(f, df):
+        core = _newton_core_jit
+    else:
+        core = _newton_core
+    root, k, converged = core(f, df, x, float(tol), int(max_iter), float(min_derivative), hist)
+
+    return NewtonResult(root, k, converged, hist[:k + 1])
+
+def _newton4_core(f, df, x, tol, max_iter, min_derivative, hist):
+    """
+    Ostrowski's fourth-order method. Same layout and return value as _newton_core.
+    """
+    hist[0] = x
+    fx = f(x)
 
     for k in range(1, max_iter + 1):
-        fx = f(x)
         dfx = df(x)
 
-        if abs(dfx) < min_derivative: 
-            return NewtonResult(x, k - 1, False, history)
+        if abs(dfx) < min_derivative:
+            return x, k - 1, False
 
-        x_new = x - fx / dfx
-        history.append(x_new)
+        # Newton predictor, then a corrector reusing f'(x)
+        y = x - fx / dfx
+        fy = f(y)
+        denom = fx - 2.0 * fy
+        x_new = y if denom == 0.0 else y - (fy / dfx) * (fx / denom)
+        hist[k] = x_new
+
+        fx_new = f(x_new)
+        if abs(fx_new) < tol or abs(x_new - x) < tol:
+            return x_new, k, True
+
+        x, fx = x_new, fx_new
+
+    return x, max_iter, False
+
+_newton4_core_jit = njit(_newton4_core)
+
+def newton4_method(
+    f: Func,
+    df: Func,
+    x0: float,
+    tol: float = 1e-8,
+    max_iter: int = 50,
+    min_derivative: float = 1e-12,
+) -> NewtonResult:
+    """
+    Solve f(x) = 0 using Ostrowski's fourth-order Newton variant.
+
+    Each iteration takes a Newton step to y and corrects it with
+    x_{n+1} = y - f(y)/f'(x_n) * f(x_n) / (f(x_n) - 2 f(y)), reusing f'(x_n).
+    That is three evaluations (f(x_n), f'(x_n), f(y)) per iteration for order 4,
+    against two for order 2 with classical Newton. Stopping rule as newton_method.
+    """
+    x = float(x0)
+    hist = np.empty(max_iter + 1, dtype=np.float64)
+
+    core = _newton4_core_jit if is_jitted(f, df) else _newton4_core
+    root, k, converged = core(f, df, x, float(tol), int(max_iter), float(min_derivative), hist)
+
+    return NewtonResult(root, k, converged, hist[:k + 1])
+
+def _newton_fixed_core(f, df, x, n_iter, hist):
+    # No convergence test: every call runs exactly n_iter steps
+    hist[0] = x
+    for k in range(1, n_iter + 1):
+        x = x - f(x) / df(x)
+        hist[k] = x
+    return x
+
+_newton_fixed_core_jit = njit(_newton_fixed_core)
+
+def newton_fixed_method(
+    f: Func,
+    df: Func,
+    x0: float,
+    n_iter: int = 6,
+    tol: float = 1e-8,
+) -> NewtonResult:
+    """
+    Run exactly n_iter Newton steps from x0, without a per-iteration convergence test.
+
+    The caller is responsible for choosing n_iter large enough for the starting
+    guess: a fixed, branch-free sequence of identical steps is cheap and
+    predictable when the root's neighbourhood is known (e.g. 6 steps from 1.5
+    reach machine precision for x^2 - 2). There is no derivative guard, so a
+    zero f'(x) produces inf/nan.
+
+    converged is decided once, after the loop, as |x_n - x_{n-1}| < tol.
+    """
+    if n_iter < 1:
+        raise ValueError("n_iter must be a positive integer.")
 
-        if abs(x_new - x) < tol:
-            return NewtonResult(x_new, k, True, history)
+    hist = np.empty(n_iter + 1, dtype=np.float64)
 
-        x = x_new
+    core = _newton_fixed_core_jit if is_jitted(f, df) else _newton_fixed_core
+    root = core(f, df, float(x0), int(n_iter), hist)
 
-    return NewtonResult(x, max_iter, False, history)
\ No newline at end of file
+    converged = bool(abs(hist[n_iter] - hist[n_iter - 1]) < tol)
+    return NewtonResult(root, n_iter, converged, hist)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from methods._jit import is_jitted, njit
+
+Number = float
+Func = Callable[[Number], Number]
+
+@dataclass(slots=True)
+class NewtonBisectResult:
+    root: float
+    iterations: int
+    converged: bool
+    history: np.ndarray
+    a_final: float
+    b_final: float
+
+def _newton_bisect_core(f, df, lo, hi, tol, max_iter, hist):
+    """
+    Safeguarded Newton loop on a bracket with f(lo) < 0 < f(hi).
+
+    Returns (root, iterations, converged, lo, hi); ``hist`` holds iterations values.
+    """
+    # Step sizes start at the bracket width, as in rtsafe
+    dx_old = dx = abs(hi - lo)
+    x = 0.5 * (lo + hi)
+    fx = f(x)
+    if fx == 0.0:
+        hist[0] = x
+        return x, 1, True, x, x
+    # The bracket always has the current iterate as one end
+    if fx < 0.0:
+        lo = x
+    else:
+        hi = x
+    dfx = df(x)
+
+    for k in range(1, max_iter + 1):
+        # Newton only if it lands inside the bracket and is at most half the
+        # step before last (dx_old, since dx still holds the last step)
+        newton_ok = (
+            ((x - hi) * dfx - fx) * ((x - lo) * dfx - fx) < 0.0
+            and abs(2.0 * fx) <= abs(dx_old * dfx)
+        )
+        dx_old = dx
+        if newton_ok:
+            dx = fx / dfx
+        else:
+            dx = x - 0.5 * (lo + hi)
+        x_new = x - dx
+        hist[k - 1] = x_new
+
+        fx = f(x_new)
+        if fx < 0.0:
+            lo = x_new
+        else:
+            hi = x_new
+
+        if abs(x_new - x) < tol or abs(fx) < tol:
+            return x_new, k, True, lo, hi
+
+        x = x_new
+        dfx = df(x)
+
+    return x, max_iter, False, lo, hi
+
+_newton_bisect_core_jit = njit(_newton_bisect_core)
+
+def newton_bisect_method(
+    f: Func,
+    df: Func,
+    a: float,
+    b: float,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+) -> NewtonBisectResult:
+    """
+    Find a root of f(x) = 0 on [a,b] with Newton steps safeguarded by bisection.
+
+    Requirements
+    - f(a) and f(b) must have opposite signs (i.e. bracket a root).
+
+    Starting from the midpoint, each iteration takes the Newton step if it stays
+    inside the current bracket and at least halves the step before last; otherwise
+    it bisects. The bracket is tightened after every step, so convergence is
+    guaranteed like bisection and quadratic near the root like Newton.
+
+    Stops when either |x_{n+1} - x_n| < tol or |f(x_{n+1})| < tol.
+    """
+    fa = f(a)
+    fb = f(b)
+
+    if fa == 0.0:
+        return NewtonBisectResult(root=a, iterations=0, converged=True, history=np.array([a], dtype=np.float64), a_final=a, b_final=a)
+    if fb == 0.0:
+        return NewtonBisectResult(root=b, iterations=0, converged=True, history=np.array([b], dtype=np.float64), a_final=b, b_final=b)
+    if fa * fb > 0:
+        raise ValueError("Newton-bisection method requires f(a) and f(b) to have opposite signs (root must be bracketed)")
+
+    # Orient the bracket so that f(lo) < 0 < f(hi)
+    lo, hi = (float(a), float(b)) if fa < 0 else (float(b), float(a))
+
+    # At least one slot: an exact midpoint is recorded even when max_iter == 0
+    hist = np.empty(max(max_iter, 1), dtype=np.float64)
+    core = _newton_bisect_core_jit if is_jitted(f, df) else _newton_bisect_core
+    root, k, converged, lo, hi = core(f, df, lo, hi, float(tol), int(max_iter), hist)
+
+    return NewtonBisectResult(
+        root=root, iterations=k, converged=converged, history=hist[:k],
+        a_final=min(lo, hi), b_final=max(lo, hi),
+    )
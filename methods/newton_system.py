@@ -1,17 +1,30 @@
 # methods/newton_system.py
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Callable, Optional, Sequence, List, Tuple
 
 import numpy as np
 
+try:
+    from scipy.linalg import lapack as _lapack
+except ImportError:  # pragma: no cover - SciPy is optional
+    _lapack = None
+
 
 Vector = np.ndarray
 Matrix = np.ndarray
 
+# |det| below this fraction of max|J_ij|^n is treated as singular by the
+# explicit small-n solve, which then defers to the LU / least-squares path
+_SINGULAR_RTOL = 1e-12
+
+# Largest system handled by backend="scalar"; beyond this NumPy wins
+_SCALAR_MAX_N = 4
+
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class NewtonSystemResult:
     root: Vector
     converged: bool
@@ -23,12 +36,92 @@ class NewtonSystemResult:
 
 
 def _as_float_vector(x0: Sequence[float] | np.ndarray) -> Vector:
-    x = np.asarray(x0, dtype=float).reshape(-1)
+    # Always a copy: the solver updates its iterates in place
+    x = np.array(x0, dtype=float).reshape(-1)
     if x.size == 0:
         raise ValueError("x0 must be a non-empty vector.")
     return x
 
 
+def _cramer_solver(J: Matrix) -> Optional[Callable[[Vector], Vector]]:
+    """
+    Explicit inverse for n = 2 or 3, or None if J is larger or numerically singular.
+
+    For these sizes a LAPACK call costs far more in call overhead than the
+    handful of flops it saves, so the adjugate is applied with plain floats.
+    """
+    n = J.shape[0]
+    if n == 2:
+        (a, b), (c, d) = J.tolist()
+        det = a * d - b * c
+        scale = max(abs(a), abs(b), abs(c), abs(d)) ** 2
+        if not abs(det) > _SINGULAR_RTOL * scale:
+            return None
+        inv = 1.0 / det
+
+        def solve2(rhs: Vector) -> Vector:
+            r0, r1 = rhs.tolist()
+            return np.array([(d * r0 - b * r1) * inv, (a * r1 - c * r0) * inv])
+
+        return solve2
+
+    if n == 3:
+        (a, b, c), (d, e, f), (g, h, i) = J.tolist()
+        # Cofactors of the first row, reused for the determinant
+        A = e * i - f * h
+        B = f * g - d * i
+        C = d * h - e * g
+        det = a * A + b * B + c * C
+        scale = max(abs(v) for v in (a, b, c, d, e, f, g, h, i)) ** 3
+        if not abs(det) > _SINGULAR_RTOL * scale:
+            return None
+        inv = 1.0 / det
+        # Rows of the adjugate (transposed cofactor matrix), scaled by 1/det
+        m00, m01, m02 = A * inv, (c * h - b * i) * inv, (b * f - c * e) * inv
+        m10, m11, m12 = B * inv, (a * i - c * g) * inv, (c * d - a * f) * inv
+        m20, m21, m22 = C * inv, (b * g - a * h) * inv, (a * e - b * d) * inv
+
+        def solve3(rhs: Vector) -> Vector:
+            r0, r1, r2 = rhs.tolist()
+            return np.array([
+                m00 * r0 + m01 * r1 + m02 * r2,
+                m10 * r0 + m11 * r1 + m12 * r2,
+                m20 * r0 + m21 * r1 + m22 * r2,
+            ])
+
+        return solve3
+
+    return None
+
+
+def _factorize(J: Matrix) -> Callable[[Vector], Vector]:
+    """
+    Return a solver rhs -> dx for J dx = rhs.
+
+    2x2 and 3x3 systems are solved with an explicit inverse (Cramer's rule).
+    Otherwise, with SciPy the LU factors of J are computed once, so every further
+    solve with the same J costs O(n^2). A singular J falls back to least squares.
+    """
+    small = _cramer_solver(J)
+    if small is not None:
+        return small
+
+    if _lapack is not None:
+        lu, piv, info = _lapack.dgetrf(J)
+        if info == 0:
+            return lambda rhs: _lapack.dgetrs(lu, piv, rhs)[0]
+        return lambda rhs: np.linalg.lstsq(J, rhs, rcond=None)[0]
+
+    def solve(rhs: Vector) -> Vector:
+        try:
+            return np.linalg.solve(J, rhs)
+        except np.linalg.LinAlgError:
+            # Fallback: least squares (handles near-singular Jacobian more gracefully)
+            return np.linalg.lstsq(J, rhs, rcond=None)[0]
+
+    return solve
+
+
 def finite_difference_jacobian(
     F: Callable[[Vector], Vector],
     x: Vector,
@@ -36,16 +129,20 @@ def finite_difference_jacobian(
     *,
     method: str = "central",
     eps: float = 1e-6,
+    F_batched: Optional[Callable[[Matrix], Matrix]] = None,
 ) -> Matrix:
     """
     Finite-difference approximation of Jacobian J(x) where J_ij = dF_i/dx_j.
+
+    If F_batched is given it must evaluate F row-wise on a (k, n) array of points
+    and return a (k, m) array; all perturbed points are then evaluated in one call
+    (two for central differences) instead of one F call per column.
     """
     x = np.asarray(x, dtype=float).reshape(-1)
     fx0 = np.asarray(F(x), dtype=float).reshape(-1) if fx is None else np.asarray(fx, dtype=float).reshape(-1)
 
     n = x.size
     m = fx0.size
-    J = np.zeros((m, n), dtype=float)
 
     if method not in ("forward", "central"):
         raise ValueError("method must be 'forward' or 'central'.")
@@ -53,17 +150,29 @@ def finite_difference_jacobian(
     # Scale step with magnitude of x to reduce cancellation issues
     h = eps * (1.0 + np.abs(x))
 
-    for j in range(n):
-        e = np.zeros_like(x)
-        e[j] = 1.0
+    if F_batched is not None:
+        # Row j of x + diag(h) is x perturbed along coordinate j
+        steps = np.diag(h)
+        f_plus = np.asarray(F_batched(x + steps), dtype=float).reshape(n, m)
 
         if method == "forward":
-            x1 = x + h[j] * e
+            return ((f_plus - fx0) / h[:, None]).T
+
+        f_minus = np.asarray(F_batched(x - steps), dtype=float).reshape(n, m)
+        return ((f_plus - f_minus) / (2.0 * h[:, None])).T
+
+    J = np.zeros((m, n), dtype=float)
+    for j in range(n):
+        if method == "forward":
+            x1 = x.copy()
+            x1[j] += h[j]
             f1 = np.asarray(F(x1), dtype=float).reshape(-1)
             J[:, j] = (f1 - fx0) / h[j]
         else:
-            x_plus = x + h[j] * e
-            x_minus = x - h[j] * e
+            x_plus = x.copy()
+            x_plus[j] += h[j]
+            x_minus = x.copy()
+            x_minus[j] -= h[j]
             f_plus = np.asarray(F(x_plus), dtype=float).reshape(-1)
             f_minus = np.asarray(F(x_minus), dtype=float).reshape(-1)
             J[:, j] = (f_plus - f_minus) / (2.0 * h[j])
@@ -71,11 +180,197 @@ def finite_difference_jacobian(
     return J
 
 
+def _solve_tuple(J: Sequence[Sequence[float]], rhs: Sequence[float]) -> Optional[List[float]]:
+    """
+    Gaussian elimination with partial pivoting on Python floats, for the scalar backend.
+
+    Returns None if a pivot is numerically zero (J is singular).
+    """
+    n = len(rhs)
+    A = [list(row) + [r] for row, r in zip(J, rhs)]
+    scale = max(abs(v) for row in J for v in row)
+
+    for col in range(n):
+        piv = max(range(col, n), key=lambda r: abs(A[r][col]))
+        if not abs(A[piv][col]) > _SINGULAR_RTOL * scale:
+            return None
+        A[col], A[piv] = A[piv], A[col]
+        pivot_row = A[col]
+        for r in range(col + 1, n):
+            row = A[r]
+            m = row[col] / pivot_row[col]
+            for c in range(col, n + 1):
+                row[c] -= m * pivot_row[c]
+
+    dx = [0.0] * n
+    for r in range(n - 1, -1, -1):
+        acc = A[r][n]
+        for c in range(r + 1, n):
+            acc -= A[r][c] * dx[c]
+        dx[r] = acc / A[r][r]
+    return dx
+
+
+def _newton_step_small(J: Sequence[Sequence[float]], fx: Sequence[float]) -> Optional[List[float]]:
+    """
+    Newton step dx solving J dx = -F(x) on Python floats, or None if J is singular.
+
+    2x2 and 3x3 use closed-form Cramer's rule (same singularity test as
+    _cramer_solver); larger systems go through _solve_tuple.
+    """
+    n = len(fx)
+    if n == 2:
+        (a, b), (c, d) = J
+        f0, f1 = fx
+        det = a * d - b * c
+        if not abs(det) > _SINGULAR_RTOL * max(abs(a), abs(b), abs(c), abs(d)) ** 2:
+            return None
+        return [(b * f1 - d * f0) / det, (c * f0 - a * f1) / det]
+
+    if n == 3:
+        (a, b, c), (d, e, f), (g, h, i) = J
+        f0, f1, f2 = fx
+        A = e * i - f * h
+        B = f * g - d * i
+        C = d * h - e * g
+        det = a * A + b * B + c * C
+        scale = max(abs(a), abs(b), abs(c), abs(d), abs(e), abs(f), abs(g), abs(h), abs(i)) ** 3
+        if not abs(det) > _SINGULAR_RTOL * scale:
+            return None
+        # -(adjugate @ F) / det
+        return [
+            -(A * f0 + (c * h - b * i) * f1 + (b * f - c * e) * f2) / det,
+            -(B * f0 + (a * i - c * g) * f1 + (c * d - a * f) * f2) / det,
+            -(C * f0 + (b * g - a * h) * f1 + (a * e - b * d) * f2) / det,
+        ]
+
+    return _solve_tuple(J, [-v for v in fx])
+
+
+def _newton_system_scalar(
+    F: Callable[..., Sequence[float]],
+    x0: Sequence[float] | np.ndarray,
+    jac: Optional[Callable[..., Sequence[Sequence[float]]]],
+    tol_f: float,
+    tol_x: float,
+    max_iter: int,
+    line_search: bool,
+    alpha0: float,
+    c1: float,
+    ls_shrink: float,
+    ls_max_steps: int,
+    fd_method: str,
+    fd_eps: float,
+) -> NewtonSystemResult:
+    # newton_system(backend="scalar"): the same iteration with x, F(x) and J(x)
+    # held as short lists/tuples of Python floats, so no NumPy call is made per
+    # iteration. F's and jac's return values are used as they are.
+    x = [float(v) for v in x0]
+    n = len(x)
+    if n == 0:
+        raise ValueError("x0 must be a non-empty vector.")
+    if n > _SCALAR_MAX_N:
+        raise ValueError(f"backend='scalar' supports n <= {_SCALAR_MAX_N}; got n={n}.")
+    if fd_method not in ("forward", "central"):
+        raise ValueError("method must be 'forward' or 'central'.")
+
+    def evaluate(v: List[float]) -> Sequence[float]:
+        fv = F(*v)
+        if len(fv) != n:
+            raise ValueError(f"System must be square: len(F(x))={len(fv)} but len(x)={n}.")
+        return fv
+
+    def fd_jacobian(v: List[float], fv: Sequence[float]) -> List[Sequence[float]]:
+        # Finite-difference columns, same steps as finite_difference_jacobian
+        cols = []
+        for j in range(n):
+            h = fd_eps * (1.0 + abs(v[j]))
+            w = list(v)
+            w[j] += h
+            plus = evaluate(w)
+            if fd_method == "forward":
+                cols.append([(p - f0) / h for p, f0 in zip(plus, fv)])
+            else:
+                w[j] = v[j] - h
+                minus = evaluate(w)
+                cols.append([(p - m) / (2.0 * h) for p, m in zip(plus, minus)])
+        return list(zip(*cols))
+
+    def result(converged: bool, iterations: int, step_norm: float, message: str) -> NewtonSystemResult:
+        return NewtonSystemResult(
+            root=np.array(x, dtype=float),
+            converged=converged,
+            iterations=iterations,
+            residual_norm=fnorm,
+            step_norm=step_norm,
+            residual_history=tuple(res_hist),
+            message=message,
+        )
+
+    hypot = math.hypot
+    fx = evaluate(x)
+    fnorm = hypot(*fx)
+    res_hist: List[float] = [fnorm]
+
+    if fnorm <= tol_f:
+        return result(True, 0, 0.0, "Already converged at initial guess.")
+
+    last_step_norm = float("inf")
+
+    for k in range(1, max_iter + 1):
+        if jac is None:
+            J = fd_jacobian(x, fx)
+        else:
+            J = jac(*x)
+            if k == 1 and (len(J) != n or any(len(row) != n for row in J)):
+                raise ValueError(f"Jacobian must be shape {(n, n)}.")
+
+        dx = _newton_step_small(J, fx)
+        if dx is None:
+            # Singular Jacobian: least squares, as in the NumPy path
+            dx = np.linalg.lstsq(np.array(J, dtype=float), -np.array(fx, dtype=float), rcond=None)[0].tolist()
+
+        step_norm = hypot(*dx)
+        last_step_norm = step_norm
+
+        if step_norm <= tol_x:
+            return result(fnorm <= tol_f, k - 1, step_norm, "Step size below tol_x (stagnation or convergence).")
+
+        alpha = alpha0
+        x_new = [xi + alpha * di for xi, di in zip(x, dx)]
+        fx_new = evaluate(x_new)
+        fnorm_new = hypot(*fx_new)
+
+        if line_search:
+            fnorm_sq = fnorm * fnorm
+            ls_steps = 0
+            while (fnorm_new * fnorm_new > (1.0 - c1 * alpha) * fnorm_sq) and (ls_steps < ls_max_steps):
+                alpha *= ls_shrink
+                x_new = [xi + alpha * di for xi, di in zip(x, dx)]
+                fx_new = evaluate(x_new)
+                fnorm_new = hypot(*fx_new)
+                ls_steps += 1
+
+        x, fx, fnorm = x_new, fx_new, fnorm_new
+        res_hist.append(fnorm)
+
+        if fnorm <= tol_f:
+            return result(True, k, last_step_norm, "Converged: residual norm below tol_f.")
+
+    return result(
+        False,
+        max_iter,
+        last_step_norm if math.isfinite(last_step_norm) else float("nan"),
+        "Max iterations reached without convergence.",
+    )
+
+
 def newton_system(
-    F: Callable[[Vector], Vector],
+    F: Optional[Callable[[Vector], Vector]],
     x0: Sequence[float] | np.ndarray,
     jac: Optional[Callable[[Vector], Matrix]] = None,
     *,
+    fjac: Optional[Callable[[Vector], Tuple[Vector, Matrix]]] = None,
     tol_f: float = 1e-10,
     tol_x: float = 1e-12,
     max_iter: int = 50,
@@ -86,6 +381,11 @@ def newton_system(
     ls_max_steps: int = 20,
     fd_method: str = "central",
     fd_eps: float = 1e-6,
+    fd_switch_tol: Optional[float] = 1e-4,
+    F_batched: Optional[Callable[[Matrix], Matrix]] = None,
+    jac_refresh: int = 1,
+    out_mode: bool = False,
+    backend: str = "numpy",
 ) -> NewtonSystemResult:
     """
     Solve a square nonlinear system F(x)=0 using Newton's method.
@@ -93,11 +393,14 @@ def newton_system(
     Parameters
     ----------
     F:
-        Function mapping R^n -> R^n.
+        Function mapping R^n -> R^n. May be None when fjac is given.
     x0:
         Initial guess.
     jac:
         Optional Jacobian function J(x) with shape (n, n). If None, finite differences are used.
+    fjac:
+        Optional function returning (F(x), J(x)) together, so work shared by F and J
+        is done once per point. When given, F and jac are not called.
     tol_f:
         Convergence tolerance on ||F(x)||_2.
     tol_x:
@@ -116,19 +419,96 @@ def newton_system(
         Max backtracking steps.
     fd_method, fd_eps:
         Finite-difference Jacobian settings (if jac is None).
+    fd_switch_tol:
+        After the first iteration, once ||F(x)||_2 <= fd_switch_tol the finite-difference
+        Jacobian uses forward differences that reuse F(x): n extra F calls instead of 2n
+        for central differences. The Jacobian error grows from O(eps^2) to O(eps), which
+        near the root barely perturbs the Newton step. None keeps fd_method throughout.
+    F_batched:
+        Optional row-wise vectorized F for the finite-difference Jacobian
+        (see finite_difference_jacobian).
+    jac_refresh:
+        Rebuild and refactor the Jacobian only every jac_refresh iterations and reuse
+        the cached factorization in between (Shamanskii-style Newton). 1 is classical
+        Newton. A refresh is forced whenever the line search fails to reduce ||F||.
+    out_mode:
+        If True, F and jac write into preallocated buffers instead of returning new
+        arrays: F(x, out) fills out (shape (n,)) and jac(x, out) fills out (shape (n, n)).
+        The buffers are allocated once and reused. Not supported together with fjac.
+    backend:
+        "numpy" (default) or "scalar". For small systems (n <= 4) "scalar" keeps x,
+        F(x) and J(x) as Python floats and never calls NumPy inside the loop (the
+        Newton step is closed-form Cramer's rule for n = 2 and 3): F is called as
+        F(*x) and returns a sequence of n floats, jac as jac(*x) and returns n rows
+        of n floats. fjac, F_batched, jac_refresh and out_mode
+        are not supported with it.
 
     Returns
     -------
     NewtonSystemResult
+
+    Notes
+    -----
+    Iterates live in two preallocated buffers that are swapped on each accepted
+    step, so F, jac and fjac must not keep references to the array they receive.
     """
+    if F is None and fjac is None:
+        raise ValueError("Either F or fjac must be provided.")
+    if jac_refresh < 1:
+        raise ValueError("jac_refresh must be a positive integer.")
+    if out_mode and fjac is not None:
+        raise ValueError("out_mode is not supported with fjac; pass F and jac.")
+    if backend == "scalar":
+        if F is None or fjac is not None or F_batched is not None or jac_refresh != 1 or out_mode:
+            raise ValueError(
+                "backend='scalar' needs F (and optionally jac) and does not support "
+                "fjac, F_batched, jac_refresh or out_mode."
+            )
+        return _newton_system_scalar(
+            F, x0, jac, tol_f, tol_x, max_iter, line_search,
+            alpha0, c1, ls_shrink, ls_max_steps, fd_method, fd_eps,
+        )
+    if backend != "numpy":
+        raise ValueError("backend must be 'numpy' or 'scalar'.")
+
+    def evaluate(v: Vector, out: Vector) -> Tuple[Vector, Optional[Matrix]]:
+        # Returns F(v) and, when fjac is used, the Jacobian at v as well.
+        # out is only written to in out_mode.
+        if out_mode:
+            F(v, out)
+            return out, None
+        if fjac is None:
+            return np.asarray(F(v), dtype=float).reshape(-1), None
+        fv, Jv = fjac(v)
+        return np.asarray(fv, dtype=float).reshape(-1), np.asarray(Jv, dtype=float)
+
     x = _as_float_vector(x0)
-    fx = np.asarray(F(x), dtype=float).reshape(-1)
+    n = x.size
+
+    if out_mode:
+        # fx and fx_spare swap on acceptance, like x and x_new below
+        fx_spare = np.empty(n)
+        J_buf = np.empty((n, n))
+
+        def F_fd(v: Vector) -> Vector:
+            # Allocating form of F for finite-difference Jacobians
+            out = np.empty(n)
+            F(v, out)
+            return out
+    else:
+        fx_spare = None
+        F_fd = F
+
+    fx, J = evaluate(x, np.empty(n))
 
     if fx.size != x.size:
         raise ValueError(f"System must be square: len(F(x))={fx.size} but len(x)={x.size}.")
 
     res_hist: List[float] = []
-    fnorm = float(np.linalg.norm(fx, ord=2))
+    # Squared norms via v @ v: the Armijo test needs ||F||^2, and sqrt is
+    # taken once per accepted point for reporting
+    fnorm_sq = float(fx @ fx)
+    fnorm = math.sqrt(fnorm_sq)
     res_hist.append(fnorm)
 
     if fnorm <= tol_f:
@@ -143,29 +523,43 @@ def newton_system(
         )
 
     last_step_norm = float("inf")
+    refresh = True
 
-    for k in range(1, max_iter + 1):
-        # Build Jacobian
-        if jac is None:
-            J = finite_difference_jacobian(F, x, fx=fx, method=fd_method, eps=fd_eps)
-        else:
-            J = np.asarray(jac(x), dtype=float)
+    # Trial points are written in place; x and x_new swap roles on acceptance
+    x_new = np.empty_like(x)
+    scratch_dx = np.empty_like(x)
 
-        if J.shape != (x.size, x.size):
-            raise ValueError(f"Jacobian must be shape {(x.size, x.size)}; got {J.shape}.")
+    for k in range(1, max_iter + 1):
+        if refresh or (k - 1) % jac_refresh == 0:
+            # Build Jacobian (fjac already returned it together with fx)
+            if fjac is None:
+                if jac is None:
+                    near_root = k > 1 and fd_switch_tol is not None and fnorm <= fd_switch_tol
+                    method = "forward" if near_root else fd_method
+                    J = finite_difference_jacobian(
+                        F_fd, x, fx=fx, method=method, eps=fd_eps, F_batched=F_batched
+                    )
+                elif out_mode:
+                    jac(x, J_buf)
+                    J = J_buf
+                else:
+                    J = np.asarray(jac(x), dtype=float)
+
+            if J.shape != (x.size, x.size):
+                raise ValueError(f"Jacobian must be shape {(x.size, x.size)}; got {J.shape}.")
+
+            solve_J = _factorize(J)
+            refresh = False
 
         # Solve J dx = -F(x)
-        try:
-            dx = np.linalg.solve(J, -fx)
-        except np.linalg.LinAlgError:
-            # Fallback: least squares (handles near-singular Jacobian more gracefully)
-            dx, *_ = np.linalg.lstsq(J, -fx, rcond=None)
+        dx = solve_J(-fx)
 
-        step_norm = float(np.linalg.norm(dx, ord=2))
+        step_norm_sq = float(dx @ dx)
+        step_norm = math.sqrt(step_norm_sq)
         last_step_norm = step_norm
 
         # Stagnation / tiny step
-        if step_norm <= tol_x:
+        if step_norm_sq <= tol_x * tol_x:
             return NewtonSystemResult(
                 root=x,
                 converged=(fnorm <= tol_f),
@@ -178,25 +572,32 @@ def newton_system(
 
         # Candidate update (with optional backtracking)
         alpha = alpha0
-        x_new = x + alpha * dx
-        fx_new = np.asarray(F(x_new), dtype=float).reshape(-1)
-        fnorm_new = float(np.linalg.norm(fx_new, ord=2))
+        np.multiply(dx, alpha, out=scratch_dx)
+        np.add(x, scratch_dx, out=x_new)
+        fx_new, J_new = evaluate(x_new, fx_spare)
+        fnorm_new_sq = float(fx_new @ fx_new)
 
         if line_search:
-            f2 = fnorm * fnorm
-            target = (1.0 - c1 * alpha) * f2
+            target = (1.0 - c1 * alpha) * fnorm_sq
             ls_steps = 0
 
-            while (fnorm_new * fnorm_new > target) and (ls_steps < ls_max_steps):
+            while (fnorm_new_sq > target) and (ls_steps < ls_max_steps):
                 alpha *= ls_shrink
-                x_new = x + alpha * dx
-                fx_new = np.asarray(F(x_new), dtype=float).reshape(-1)
-                fnorm_new = float(np.linalg.norm(fx_new, ord=2))
-                target = (1.0 - c1 * alpha) * f2
+                np.multiply(dx, alpha, out=scratch_dx)
+                np.add(x, scratch_dx, out=x_new)
+                fx_new, J_new = evaluate(x_new, fx_spare)
+                fnorm_new_sq = float(fx_new @ fx_new)
+                target = (1.0 - c1 * alpha) * fnorm_sq
                 ls_steps += 1
 
+            # No sufficient decrease: a stale Jacobian is the likely culprit
+            refresh = fnorm_new_sq > target
+
         # Accept
-        x, fx, fnorm = x_new, fx_new, fnorm_new
+        x, x_new = x_new, x
+        fx, fx_spare = fx_new, fx
+        fnorm_sq, J = fnorm_new_sq, J_new
+        fnorm = math.sqrt(fnorm_sq)
         res_hist.append(fnorm)
 
         if fnorm <= tol_f:
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from functools import lru_cache, partial
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+from methods._jit import njit
+from methods.bisection import bisection_method
+from methods.brent import brent_method
+from methods.newton import NewtonResult, newton_method
+from methods.secant import secant_method
+
+Number = float
+Func = Callable[[Number], Number]
+
+try:
+    # Built on demand by `python -m methods._aot_build`
+    from methods import _solver_aot
+except ImportError:
+    _solver_aot = None
+
+def _normalize(coeffs: Sequence[float]) -> Tuple[float, ...]:
+    # Highest degree first (np.polyval order), without leading zeros
+    c = [float(v) for v in coeffs]
+    while c and c[0] == 0.0:
+        c.pop(0)
+    if not c:
+        raise ValueError("Polynomial must have at least one non-zero coefficient.")
+    return tuple(c)
+
+def poly_derivative(coeffs: Sequence[float]) -> List[float]:
+    """
+    Coefficients of p'(x), highest degree first. A constant has derivative [0.0].
+    """
+    c = _normalize(coeffs)
+    n = len(c) - 1
+    if n == 0:
+        return [0.0]
+    return [ci * (n - i) for i, ci in enumerate(c[:-1])]
+
+def horner_string(coeffs: Sequence[float], var: str = "x") -> str:
+    """
+    Python expression evaluating the polynomial in Horner form.
+
+    coeffs are ordered highest degree first, e.g. [1, 0, -2] -> "x * x + -2.0".
+    Degree d costs d multiplications and at most d additions; no power operator.
+    """
+    c = _normalize(coeffs)
+
+    expr = repr(c[0])
+    for ci in c[1:]:
+        if expr == "1.0":
+            expr = var
+        else:
+            expr = f"({expr}) * {var}" if " " in expr else f"{expr} * {var}"
+        if ci != 0.0:
+            expr = f"{expr} + {ci!r}"
+    return expr
+
+@lru_cache(maxsize=128)
+def _compile_poly(coeffs: Tuple[float, ...]) -> Func:
+    # Source is generated, so Numba has no file to cache it in: compile in memory only
+    namespace: dict = {}
+    exec(f"def p(x):\n    return {horner_string(coeffs)}\n", namespace)
+    return njit(namespace["p"])
+
+def make_poly_root_kernel(coeffs: Sequence[float], method: str = "newton") -> Callable:
+    """
+    Specialize a root finder to the polynomial with the given coefficients.
+
+    The polynomial (and its derivative for Newton) is generated as a Horner
+    expression and compiled with Numba when available, so the chosen method
+    runs its compiled kernel. Returns the method with f (and df) bound, e.g.
+    make_poly_root_kernel([1, 0, -2], "newton")(x0=1.5).
+    """
+    c = _normalize(coeffs)
+    if len(c) < 2:
+        raise ValueError("Polynomial must have degree >= 1.")
+
+    f = _compile_poly(c)
+    method = method.lower()
+
+    if method == "newton":
+        df = _compile_poly(tuple(poly_derivative(c)))
+        return partial(newton_method, f, df)
+    if method == "secant":
+        return partial(secant_method, f)
+    if method == "bisection":
+        return partial(bisection_method, f)
+    if method == "brent":
+        return partial(brent_method, f)
+
+    raise ValueError(
+        f"Unknown method: {method}. Choose 'newton', 'secant', 'bisection', or 'brent'."
+    )
+
+def poly_newton(
+    coeffs: Sequence[float],
+    x0: float,
+    tol: float = 1e-8,
+    max_iter: int = 50,
+) -> NewtonResult:
+    """
+    Newton's method on a polynomial given by its coefficients (highest degree first).
+
+    Uses the ahead-of-time compiled kernel when methods._solver_aot has been built
+    (no JIT warm-up), otherwise make_poly_root_kernel. Both give the same iterates.
+    """
+    if _solver_aot is None:
+        return make_poly_root_kernel(coeffs, "newton")(x0, tol=tol, max_iter=max_iter)
+
+    c = _normalize(coeffs)
+    if len(c) < 2:
+        raise ValueError("Polynomial must have degree >= 1.")
+
+    hist = np.empty(max_iter + 1, dtype=np.float64)
+    root, k, converged = _solver_aot.poly_newton_f8(
+        np.array(c), np.array(poly_derivative(c)), float(x0), float(tol), int(max_iter), 1e-12, hist
+    )
+    return NewtonResult(root, k, converged, hist[:k + 1])
@@ -1,17 +1,61 @@
 from __future__ import annotations
 
 from dataclasses import dataclass 
-from typing import Callable, List
+from typing import Callable
+
+import numpy as np
+
+from methods._ckernels import secant_core as _secant_core_c, use_c_kernels
+from methods._jit import is_jitted, njit
 
 Number = float
 Func = Callable[[Number], Number]
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class SecantResult:
     root: float
     iterations: int
     converged: bool
-    history: List[float]
+    history: np.ndarray
+
+def _secant_core(f, x0, x1, tol, max_iter, min_denom, hist):
+    """
+    Secant loop. Writes x_0, x_1, x_2, ... into ``hist``.
+
+    Returns (root, iterations, converged); ``hist`` holds iterations + 2 values.
+    """
+    fx0 = f(x0)
+    fx1 = f(x1)
+
+    hist[0] = x0
+    hist[1] = x1
+
+    # An exact zero is a root even when f(x1) - f(x0) is too small to divide by
+    if fx1 == 0.0:
+        return x1, 0, True
+    if fx0 == 0.0:
+        return x0, 0, True
+
+    for k in range(1, max_iter + 1):
+        denom = fx1 - fx0
+        if abs(denom) < min_denom:
+            return x1, k - 1, False
+
+        x2 = x1 - fx1 * (x1 - x0) / denom
+        hist[k + 1] = x2
+
+        if abs(x2 - x1) <= tol:
+            return x2, k, True
+
+        x0, x1 = x1, x2
+        fx0, fx1 = fx1, f(x1)
+
+        if abs(fx1) < tol:
+            return x1, k, True
+
+    return x1, max_iter, False
+
+_secant_core_jit = njit(_secant_core)
 
 def secant_method(
     f: Func,
@@ -31,7 +75,7 @@ def secant_method(
     x0, x1: float
         Two initial guesses. (No need to bracket the root, but they should be close to it for good convergence.)
     tol: float
-        Convergence tolerance on step size |x_{n+1} - x_n|.
+        Convergence tolerance on step size |x_{n+1} - x_n| or on the residual |f(x_{n+1})|.
     max_iter : int
         Maximum iterations.
     min_denom : float
@@ -42,23 +86,14 @@ def secant_method(
     SecantResult
         root, iterations, converged and history.     
     """
-    fx0 = f(x0)
-    fx1 = f(x1)
-
-    history: List[float] = [x0, x1]
-
-    for k in range(1, max_iter + 1):
-        denom = fx1 - fx0
-        if abs(denom) < min_denom:
-            return SecantResult(root=x1, iterations=k - 1, converged=False, history=history)
-
-        x2 = x1 - fx1 * (x1 - x0) / denom
-        history.append(x2)
+    hist = np.empty(max_iter + 2, dtype=np.float64)
 
-        if abs(x2 - x1) <= tol:
-            return SecantResult(root=x2, iterations=k, converged=True, history=history)
-
-        x0, x1 = x1, x2
-        fx0, fx1 = fx1, f(x1)
+    if use_c_kernels(f):
+        core = _secant_core_c
+    elif is_jitted(f):
+        core = _secant_core_jit
+    else:
+        core = _secant_core
+    root, k, converged = core(f, float(x0), float(x1), float(tol), int(max_iter), float(min_denom), hist)
 
-    return SecantResult(root=x1, iterations=max_iter, converged=False, history=history)
\ No newline at end of file
+    return SecantResult(root=root, iterations=k, converged=converged, history=hist[:k + 2])
@@ -1,13 +1,122 @@
-from typing import Callable, Optional, Sequence
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
 
 from methods.bisection import bisection_method
-from methods.newton import newton_method
+from methods.newton import newton4_method, newton_fixed_method, newton_method
 from methods.secant import secant_method
 from methods.brent import brent_method
+from methods.halley import halley_method
+from methods.illinois import illinois_method
+from methods.newton_bisect import newton_bisect_method
+from methods.batch import bisection_batch, newton_batch, secant_batch
+from methods._ckernels import HAVE_C_KERNELS, as_c_function
+from methods._jit import NUMBA_ERRORS, as_jitted, is_jitted, njit
 
 from methods.newton_system import newton_system  # NEW
 
 
+# Scalar dispatch for solve(): every entry takes (f, df, d2f, x0, x1, a, b, tol, max_iter)
+def _newton(f, df, d2f, x0, x1, a, b, tol, max_iter):
+    return newton_method(f, df, x0, tol=tol, max_iter=max_iter)
+
+
+def _newton4(f, df, d2f, x0, x1, a, b, tol, max_iter):
+    return newton4_method(f, df, x0, tol=tol, max_iter=max_iter)
+
+
+def _newton_fixed(f, df, d2f, x0, x1, a, b, tol, max_iter):
+    # No convergence test inside the loop: max_iter is the exact step count,
+    # and None keeps newton_fixed_method's own default
+    if max_iter is None:
+        return newton_fixed_method(f, df, x0, tol=tol)
+    return newton_fixed_method(f, df, x0, n_iter=max_iter, tol=tol)
+
+
+def _secant(f, df, d2f, x0, x1, a, b, tol, max_iter):
+    return secant_method(f, x0=x0, x1=x1, tol=tol, max_iter=max_iter)
+
+
+def _bisection(f, df, d2f, x0, x1, a, b, tol, max_iter):
+    return bisection_method(f, a=a, b=b, tol=tol, max_iter=max_iter)
+
+
+def _brent(f, df, d2f, x0, x1, a, b, tol, max_iter):
+    return brent_method(f, a=a, b=b, tol=tol, max_iter=max_iter)
+
+
+def _newton_bisect(f, df, d2f, x0, x1, a, b, tol, max_iter):
+    return newton_bisect_method(f, df, a=a, b=b, tol=tol, max_iter=max_iter)
+
+
+def _illinois(f, df, d2f, x0, x1, a, b, tol, max_iter):
+    return illinois_method(f, a=a, b=b, tol=tol, max_iter=max_iter)
+
+
+def _halley(f, df, d2f, x0, x1, a, b, tol, max_iter):
+    return halley_method(f, df, d2f, x0, tol=tol, max_iter=max_iter)
+
+
+_METHODS = {
+    "newton": _newton,
+    "newton4": _newton4,
+    "newton_fixed": _newton_fixed,
+    "secant": _secant,
+    "bisection": _bisection,
+    "brent": _brent,
+    "newton_bisect": _newton_bisect,
+    "illinois": _illinois,
+    "halley": _halley,
+}
+
+# Methods with a compiled C kernel (backend="c")
+_C_METHODS = {name: _METHODS[name] for name in ("newton", "secant", "bisection", "brent")}
+
+# Methods started from a single guess, which solve_sweep can warm-start
+_SWEEP_METHODS = {name: _METHODS[name] for name in ("newton", "newton4", "newton_fixed", "halley")}
+
+# Name used in error messages and the arguments each method cannot do without
+_REQUIRED = {
+    "newton": ("Newton's method", ("df", "x0")),
+    "newton4": ("Newton4 method", ("df", "x0")),
+    "newton_fixed": ("Fixed-iteration Newton", ("df", "x0")),
+    "secant": ("Secant method", ("x0", "x1")),
+    "bisection": ("Bisection method", ("a", "b")),
+    "brent": ("Brent's method", ("a", "b")),
+    "newton_bisect": ("Newton-bisection method", ("df", "a", "b")),
+    "illinois": ("Illinois method", ("a", "b")),
+    "halley": ("Halley's method", ("df", "d2f", "x0")),
+}
+
+# methods that can derive df from f when called with autodiff=True
+_AUTODIFF_METHODS = ("newton",)
+
+
+def _snap_to_zero(f: Callable[[float], float], ftol: float) -> Callable[[float], float]:
+    # f with residuals up to ftol reported as exactly zero; stays jitted if f is
+    if not is_jitted(f):
+        return _snapped(f, ftol)
+    # Kept on the dispatcher itself, so repeated solves with the same @njit f
+    # reuse the compiled wrapper and the cache goes away together with f
+    cache = f.__dict__.setdefault("_snapped_by_ftol", {})
+    if ftol not in cache:
+        cache[ftol] = njit(_snapped(f, ftol))
+    return cache[ftol]
+
+
+def _snapped(f: Callable[[float], float], ftol: float) -> Callable[[float], float]:
+    def snapped(x):
+        y = f(x)
+        return 0.0 if abs(y) <= ftol else y
+
+    return snapped
+
+
+def _method_names(methods: dict) -> str:
+    names = [f"'{name}'" for name in methods]
+    return ", ".join(names[:-1]) + f", or {names[-1]}"
+
+
 def solve(
     method: str,
     f: Callable[[float], float],
@@ -17,47 +126,218 @@ def solve(
     a: Optional[float] = None,
     b: Optional[float] = None,
     tol: float = 1e-8,
-    max_iter: int = 50,
+    max_iter: Optional[int] = None,
+    autodiff: bool = False,
+    vectorized: bool = False,
+    jit: bool = False,
+    backend: str = "auto",
+    d2f: Optional[Callable[[float], float]] = None,
+    ftol: Optional[float] = None,
 ):
     """
     Solve a scalar root-finding problem f(x)=0 using the specified method.
+
+    d2f (the second derivative) is only used by method="halley".
+
+    max_iter defaults to 50. method="newton_fixed" runs exactly max_iter steps
+    and, when max_iter is not given, keeps newton_fixed_method's default.
+
+    ftol, if given, snaps f to exactly 0.0 wherever |f(x)| <= ftol. Every method
+    stops on an exact zero, so it ends as soon as the residual is small enough
+    instead of continuing to shrink the step or bracket below tol.
+
+    With autodiff=True Newton's method may be called without df; the derivative
+    is then derived from f (see newton_method).
+
+    With vectorized=True, f (and df) take and return 1-D arrays, x0/x1/a/b are
+    arrays with one entry per problem, and all problems are solved together
+    (see solve_batch). The result holds arrays of roots, iterations and flags.
+    jit, autodiff, d2f and backend='c' are not supported there and raise.
+
+    Every method runs its iteration in a compiled kernel when f (and df/d2f)
+    are Numba @njit functions. newton, secant, bisection and brent use the C
+    kernels instead when f (and df) are C functions (see backend).
+
+    With jit=True, plain Python f and df are compiled with Numba first, so the
+    method runs its compiled kernel and the loop never re-enters the interpreter.
+    They are compiled afresh on every call, so changed globals are picked up;
+    pass @njit functions instead to reuse the compiled code across calls.
+    A function Numba cannot compile raises ValueError. Without Numba installed
+    the flag has no effect.
+
+    backend="c" runs newton, secant, bisection or brent in the compiled C kernels
+    (methods/_kernels.c, built separately). f and df must then be C functions
+    ``double (double)``: ctypes function pointers, Numba @cfunc objects or
+    scipy.LowLevelCallable. backend="auto" (default) uses the C kernels whenever
+    they are built and f/df happen to be C functions, and Python/Numba otherwise.
+    """
+    if backend not in ("auto", "c"):
+        raise ValueError("backend must be 'auto' or 'c'.")
+
+    if max_iter is None and method.lower() != "newton_fixed":
+        max_iter = 50
+
+    if vectorized:
+        unsupported = {
+            "jit": jit,
+            "autodiff": autodiff,
+            "d2f": d2f is not None,
+            "backend='c'": backend == "c",
+        }
+        rejected = [name for name, given in unsupported.items() if given]
+        if rejected:
+            raise ValueError(f"vectorized=True does not support {', '.join(rejected)}.")
+        return solve_batch(
+            method, f, df=df, x0=x0, x1=x1, a=a, b=b, tol=tol, max_iter=max_iter, ftol=ftol
+        )
+
+    if jit:
+        f, df, d2f = as_jitted(f), as_jitted(df), as_jitted(d2f)
+
+    if ftol is not None:
+        if backend == "c":
+            raise ValueError("ftol is not supported with backend='c'.")
+        f = _snap_to_zero(f, float(ftol))
+
+    method = method.lower()
+
+    if backend == "c":
+        if method not in _C_METHODS:
+            raise ValueError(f"backend='c' supports {_method_names(_C_METHODS)}; got {method}.")
+        if not HAVE_C_KERNELS:
+            raise RuntimeError("C kernels are not built; see methods/_kernels.c for the build command.")
+        f_c, df_c = as_c_function(f), as_c_function(df)
+        if f_c is None or (df is not None and df_c is None):
+            raise ValueError("backend='c' requires f (and df) to be C functions 'double (double)'.")
+        f, df = f_c, df_c
+
+    try:
+        impl = _METHODS[method]
+    except KeyError:
+        raise ValueError(
+            f"Unknown method: {method}. Choose {_method_names(_METHODS)}."
+        ) from None
+
+    label, required = _REQUIRED[method]
+    given = {"df": df, "d2f": d2f, "x0": x0, "x1": x1, "a": a, "b": b}
+    waive_df = autodiff and method in _AUTODIFF_METHODS
+    if any(given[name] is None for name in required if not (waive_df and name == "df")):
+        if method in _AUTODIFF_METHODS:
+            required = tuple("df (or autodiff=True)" if name == "df" else name for name in required)
+        raise ValueError(f"{label} requires {' and '.join(required)}")
+
+    if not jit:
+        return impl(f, df, d2f, x0, x1, a, b, tol, max_iter)
+    try:
+        return impl(f, df, d2f, x0, x1, a, b, tol, max_iter)
+    except NUMBA_ERRORS as err:
+        raise ValueError(
+            "jit=True: Numba could not compile f (or df/d2f); pass jit=False to run it as plain Python."
+        ) from err
+
+
+def solve_sweep(
+    method: str,
+    f_factory: Callable[[float], "Callable | Tuple[Callable, ...]"],
+    params: Sequence[float],
+    x0: float,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Solve f_p(x)=0 for each parameter p in params, warm-starting from the previous root.
+
+    f_factory(p) returns f, or a tuple (f, df) or (f, df, d2f), for that parameter.
+    The first problem starts from x0; every later one starts from the last root
+    that converged. For slowly varying p (a sorted sweep) consecutive roots are
+    close, so methods with quadratic or better convergence need only a few
+    iterations each.
+
+    Supported methods are those started from a single guess x0: 'newton',
+    'newton4', 'newton_fixed' and 'halley'. Further keyword arguments go to solve().
+
+    Returns the array of roots, with NaN where a solve did not converge.
     """
     method = method.lower()
+    if method not in _SWEEP_METHODS:
+        raise ValueError(f"solve_sweep supports {_method_names(_SWEEP_METHODS)}; got {method}.")
+
+    roots = np.empty(len(params))
+    for i, p in enumerate(params):
+        funcs = f_factory(p)
+        if callable(funcs):
+            funcs = (funcs,)
+        names = ("f", "df", "d2f")[:len(funcs)]
+
+        result = solve(method, x0=x0, **dict(zip(names, funcs)), **kwargs)
+        if result.converged:
+            roots[i] = x0 = result.root
+        else:
+            roots[i] = np.nan
+
+    return roots
+
+
+def solve_batch(
+    method: str,
+    f: Callable,
+    df: Optional[Callable] = None,
+    x0=None,
+    x1=None,
+    a=None,
+    b=None,
+    tol: float = 1e-8,
+    max_iter: int = 50,
+    ftol: Optional[float] = None,
+):
+    """
+    Solve N scalar root-finding problems f(x_i)=0 at once.
+
+    f must be vectorized: it receives a 1-D array holding one point per
+    problem and returns the array of function values.
+
+    Currently supported:
+      - method="newton" (df vectorized like f, x0 an array of guesses)
+      - method="secant" (x0, x1 arrays of guesses)
+      - method="bisection" (a, b arrays of bracket endpoints)
+
+    ftol (bisection only) stops each problem once |f(x_i)| <= ftol.
+    """
+    method = method.lower()
+
+    if ftol is not None and method != "bisection":
+        raise ValueError("ftol is only supported by the bisection batch method.")
 
     if method == "newton":
         if df is None or x0 is None:
             raise ValueError("Newton's method requires df and x0")
-        return newton_method(f, df, x0, tol=tol, max_iter=max_iter)
+        return newton_batch(f, df, x0, tol=tol, max_iter=max_iter)
 
     if method == "secant":
         if x0 is None or x1 is None:
             raise ValueError("Secant method requires x0 and x1")
-        return secant_method(f, x0=x0, x1=x1, tol=tol, max_iter=max_iter)
+        return secant_batch(f, x0=x0, x1=x1, tol=tol, max_iter=max_iter)
 
     if method == "bisection":
         if a is None or b is None:
             raise ValueError("Bisection method requires a and b")
-        return bisection_method(f, a=a, b=b, tol=tol, max_iter=max_iter)
-
-    if method == "brent":
-        if a is None or b is None:
-            raise ValueError("Brent's method requires a and b")
-        return brent_method(f, a=a, b=b, tol=tol, max_iter=max_iter)
+        return bisection_batch(f, a=a, b=b, tol=tol, max_iter=max_iter, residual_tol=ftol)
 
     raise ValueError(
-        f"Unknown method: {method}. Choose 'newton', 'secant', 'bisection', or 'brent'."
+        f"Unknown batch method: {method}. Choose 'newton', 'secant', or 'bisection'."
     )
 
 
 def solve_system(
     method: str,
-    F: Callable[["Sequence[float]"], "Sequence[float]"],
+    F: Optional[Callable[["Sequence[float]"], "Sequence[float]"]],
     x0: Sequence[float],
     jac: Optional[Callable[["Sequence[float]"], "Sequence[Sequence[float]]"]] = None,
+    fjac: Optional[Callable[["Sequence[float]"], "Tuple[Sequence[float], Sequence[Sequence[float]]]"]] = None,
     tol_f: float = 1e-10,
     tol_x: float = 1e-12,
     max_iter: int = 50,
     line_search: bool = True,
+    backend: str = "numpy",
 ):
     """
     Solve a nonlinear system F(x)=0 for x in R^n using the specified method.
@@ -68,6 +348,8 @@ def solve_system(
     Notes
     -----
     - If jac is None, a finite-difference Jacobian is used.
+    - fjac may be given instead of F/jac to return (F(x), J(x)) in one call.
+    - backend="scalar" runs small systems on Python floats (see newton_system).
     - tol_f is the tolerance on ||F(x)||_2.
     - tol_x is the tolerance on ||dx||_2.
     """
@@ -78,10 +360,12 @@ def solve_system(
             F,
             x0=x0,
             jac=jac,
+            fjac=fjac,
             tol_f=tol_f,
             tol_x=tol_x,
             max_iter=max_iter,
             line_search=line_search,
+            backend=backend,
         )
 
     raise ValueError(
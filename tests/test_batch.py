@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from methods.batch import RootResult, bisection_batch, newton_batch, secant_batch
+from methods.bisection import bisection_method
+from methods.newton import newton_method
+from methods.secant import secant_method
+from methods.solver import solve_batch
+
+def test_bisection_batch_sqrt():
+    k = np.arange(1.0, 8.0)
+    f_vec = lambda x: x**2 - k
+
+    result = bisection_batch(f_vec, a=np.zeros_like(k), b=k + 1.0, tol=1e-10, max_iter=200)
+
+    assert result.converged.all()
+    assert np.allclose(result.root, np.sqrt(k), rtol=0, atol=1e-9)
+
+    # Every problem follows exactly the scalar iteration
+    for i, ki in enumerate(k):
+        scalar = bisection_method(lambda x: x**2 - ki, a=0.0, b=ki + 1.0, tol=1e-10, max_iter=200)
+        assert result.root[i] == scalar.root
+        assert result.iterations[i] == scalar.iterations
+
+def test_bisection_batch_requires_bracket():
+    f_vec = lambda x: x**2 + 1
+
+    with pytest.raises(ValueError):
+        bisection_batch(f_vec, a=np.array([1.0, -1.0]), b=np.array([2.0, 1.0]))
+
+def test_solve_batch_bisection():
+    f_vec = lambda x: x**2 - 2
+
+    result = solve_batch("bisection", f_vec, a=np.ones(5), b=np.full(5, 2.0))
+
+    assert result.converged.all()
+    assert np.allclose(result.root, np.sqrt(2), rtol=1e-8)
+
+def test_newton_batch_matches_scalar():
+    k = np.arange(1.0, 8.0)
+    x0 = np.full_like(k, 1.5)
+
+    result = newton_batch(lambda x: x**2 - k, lambda x: 2 * x, x0)
+
+    assert result.converged.all()
+    assert np.allclose(result.root, np.sqrt(k), rtol=1e-12)
+    for i, ki in enumerate(k):
+        scalar = newton_method(lambda x: x**2 - ki, lambda x: 2 * x, x0=1.5)
+        assert result.root[i] == scalar.root
+        assert result.iterations[i] == scalar.iterations
+
+def test_newton_batch_freezes_flat_derivative():
+    # x0 = 0 hits df = 0 immediately; the other problem must still converge
+    result = newton_batch(lambda x: x**2 - 2, lambda x: 2 * x, np.array([0.0, 1.5]))
+
+    assert not result.converged[0]
+    assert result.iterations[0] == 0
+    assert result.converged[1]
+    assert np.isclose(result.root[1], np.sqrt(2), rtol=1e-12)
+
+def test_secant_batch_matches_scalar():
+    k = np.arange(1.0, 8.0)
+
+    result = secant_batch(lambda x: x**2 - k, x0=np.ones_like(k), x1=k + 1.0, tol=1e-10, max_iter=100)
+
+    assert result.converged.all()
+    assert np.allclose(result.root, np.sqrt(k), rtol=1e-10)
+    for i, ki in enumerate(k):
+        scalar = secant_method(lambda x: x**2 - ki, x0=1.0, x1=ki + 1.0, tol=1e-10, max_iter=100)
+        assert result.root[i] == scalar.root
+        assert result.iterations[i] == scalar.iterations
+
+def test_solve_batch_newton_and_secant():
+    f_vec = lambda x: x**2 - 2
+
+    newton = solve_batch("newton", f_vec, df=lambda x: 2 * x, x0=np.full(4, 1.5))
+    secant = solve_batch("secant", f_vec, x0=np.ones(4), x1=np.full(4, 2.0))
+
+    assert newton.converged.all() and secant.converged.all()
+    assert np.allclose(newton.root, np.sqrt(2), rtol=1e-8)
+    assert np.allclose(secant.root, np.sqrt(2), rtol=1e-8)
+
+def test_batch_function_calls():
+    k = np.arange(1.0, 5.0)
+    f_vec = lambda x: x**2 - k
+
+    bis = bisection_batch(f_vec, a=np.zeros_like(k), b=k + 1.0)
+    newton = newton_batch(f_vec, lambda x: 2 * x, x0=np.full_like(k, 3.0))
+
+    # f(a), f(b) and one midpoint per iteration; f(x0), then df and f per step
+    assert np.array_equal(bis.function_calls, bis.iterations + 2)
+    assert np.array_equal(newton.function_calls, 2 * newton.iterations + 1)
+
+def test_batch_result_indexing():
+    k = np.arange(1.0, 5.0)
+    result = solve_batch("newton", lambda x: x**2 - k, df=lambda x: 2 * x, x0=np.full_like(k, 1.5))
+
+    assert len(result) == 4
+    one = result[2]
+    assert isinstance(one, RootResult)
+    assert one.root == result.root[2] and one.converged
+    assert one.iterations == result.iterations[2]
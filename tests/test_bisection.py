@@ -1,4 +1,5 @@
 import math 
+import numpy as np
 import pytest
 
 from methods.bisection import bisection_method
@@ -16,4 +17,39 @@ def test_bisection_requires_bracket():
     f = lambda x: x**2 + 1 # No real roots, so f(a) and f(b) will have the same sign (positive)
 
     with pytest.raises(ValueError):
-        bisection_method(f, a=1.0, b=1.0)
\ No newline at end of file
+        bisection_method(f, a=1.0, b=1.0)
+
+def test_bisection_jitted_matches_python():
+    numba = pytest.importorskip("numba")
+    f = lambda x: x**2 - 2
+
+    expected = bisection_method(f, a=1.0, b=2.0, tol=1e-10, max_iter=200)
+    result = bisection_method(numba.njit(f), a=1.0, b=2.0, tol=1e-10, max_iter=200)
+
+    assert result.converged
+    assert result.root == expected.root
+    assert np.array_equal(result.history, expected.history)
+
+
+def test_bisection_residual_tol_stops_early():
+    f = lambda x: x**2 - 2
+
+    interval_only = bisection_method(f, a=1.0, b=2.0, tol=1e-10, max_iter=200)
+    with_residual = bisection_method(f, a=1.0, b=2.0, tol=1e-10, max_iter=200, residual_tol=1e-4)
+
+    assert with_residual.converged
+    assert abs(f(with_residual.root)) <= 1e-4
+    assert with_residual.iterations < interval_only.iterations
+
+def test_bisection_function_calls():
+    calls = 0
+
+    def f(x):
+        nonlocal calls
+        calls += 1
+        return x**2 - 2
+
+    result = bisection_method(f, a=1.0, b=2.0, tol=1e-10, max_iter=200)
+
+    assert result.function_calls == result.iterations + 2
+    assert calls == result.function_calls
@@ -1,4 +1,5 @@
 import math
+import pytest
 from methods.brent import brent_method
 
 def test_brent_sqrt2():
@@ -7,4 +8,28 @@ def test_brent_sqrt2():
     result = brent_method(f, a=1.0, b=2.0)
 
     assert result.converged
-    assert abs(result.root - math.sqrt(2)) < 1e-8
\ No newline at end of file
+    assert abs(result.root - math.sqrt(2)) < 1e-8
+
+def test_brent_evaluates_f_once_per_iteration():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return x**2 - 2
+
+    result = brent_method(f, a=1.0, b=2.0)
+
+    assert result.converged
+    assert len(calls) == result.iterations + 2
+
+
+def test_brent_jitted_matches_python():
+    numba = pytest.importorskip("numba")
+    f = lambda x: x**2 - 2
+
+    expected = brent_method(f, a=1.0, b=2.0)
+    result = brent_method(numba.njit(f), a=1.0, b=2.0)
+
+    assert result.converged
+    assert result.iterations == expected.iterations
+    assert result.root == expected.root
@@ -0,0 +1,71 @@
+import ctypes
+import math
+
+import numpy as np
+import pytest
+
+from methods._ckernels import HAVE_C_KERNELS, c_function, use_c_kernels
+from methods.bisection import bisection_method
+from methods.brent import brent_method
+from methods.newton import newton_method
+from methods.secant import secant_method
+from methods.solver import solve
+
+CFunc = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_double)
+
+needs_c = pytest.mark.skipif(not HAVE_C_KERNELS, reason="C kernels not built (see methods/_kernels.c)")
+
+def test_c_function_rejects_python_callables():
+    assert c_function(lambda x: x) is None
+    assert c_function(CFunc(lambda x: x)) is not None
+    assert not use_c_kernels(lambda x: x)
+
+def test_capsule_lookup_leaves_pythonapi_prototypes_alone():
+    assert ctypes.pythonapi.PyCapsule_GetPointer.restype is ctypes.c_int
+    assert ctypes.pythonapi.PyCapsule_GetName.argtypes is None
+
+@needs_c
+@pytest.mark.parametrize("solve", [
+    lambda f, df: newton_method(f, df, x0=1.5, tol=1e-10),
+    lambda f, df: secant_method(f, x0=1.0, x1=2.0, tol=1e-10),
+    lambda f, df: bisection_method(f, a=1.0, b=2.0, tol=1e-10),
+    lambda f, df: brent_method(f, a=1.0, b=2.0, tol=1e-10),
+])
+def test_c_kernels_match_python(solve):
+    f = lambda x: x**2 - 2
+    df = lambda x: 2 * x
+
+    expected = solve(f, df)
+    result = solve(CFunc(f), CFunc(df))
+
+    assert result.converged
+    assert result.iterations == expected.iterations
+    assert result.root == expected.root
+    np.testing.assert_array_equal(result.history, expected.history)
+    assert math.isclose(result.root, math.sqrt(2), rel_tol=1e-9)
+
+@needs_c
+def test_solve_c_backend():
+    scipy = pytest.importorskip("scipy")
+    f = CFunc(lambda x: x**2 - 2)
+    df = CFunc(lambda x: 2 * x)
+
+    result = solve(method="newton", f=scipy.LowLevelCallable(f), df=df, x0=1.5, backend="c")
+
+    assert result.converged
+    assert result.root == newton_method(f, df, x0=1.5).root
+
+    with pytest.raises(ValueError):
+        solve(method="brent", f=lambda x: x**2 - 2, a=1.0, b=2.0, backend="c")
+
+@needs_c
+def test_c_secant_stops_on_exact_zero():
+    # f(x0) - f(x1) == 0 would trip the denominator guard
+    f = lambda x: 0.0 if abs(x) < 1e-3 else x
+
+    for func in (f, CFunc(f)):
+        result = secant_method(func, x0=-1e-4, x1=1e-4)
+
+        assert result.converged
+        assert result.iterations == 0
+        assert result.root == 1e-4
@@ -1,4 +1,5 @@
-import math 
+import math
+import numpy as np
 from methods.bisection import bisection_method
 from methods.newton import newton_method
 from methods.secant import secant_method
@@ -34,3 +35,8 @@ def test_convergence_orders():
     k = len(bis.history)
     steps = max(0, k - 1)
     assert final_width <= initial_width / (2 ** steps) + 1e-12
+
+def test_estimate_order_accepts_arrays():
+    errors = np.array([1e-1, 1e-2, 1e-4, 1e-8, 0.0])
+
+    assert math.isclose(estimate_order(errors), 2.0, rel_tol=1e-12)
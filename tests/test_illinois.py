@@ -0,0 +1,44 @@
+import math
+import pytest
+
+from methods.bisection import bisection_method
+from methods.illinois import illinois_method
+from methods.solver import solve
+
+def test_illinois_sqrt2():
+    f = lambda x: x**2 - 2
+
+    result = solve(method='illinois', f=f, a=1.0, b=2.0)
+    bisection = bisection_method(f, a=1.0, b=2.0)
+
+    assert result.converged
+    assert math.isclose(result.root, math.sqrt(2), rel_tol=1e-8)
+    assert result.a_final <= result.root <= result.b_final
+    # 7 iterations against 27 for bisection
+    assert result.iterations <= bisection.iterations // 3
+
+def test_illinois_requires_bracket():
+    with pytest.raises(ValueError):
+        illinois_method(lambda x: x**2 + 1, a=1.0, b=2.0)
+
+def test_illinois_skewed_bracket():
+    # Tiny false-position steps on a wide bracket are not convergence
+    f = lambda x: x**10 - 1
+
+    result = illinois_method(f, a=0.0, b=100.0, tol=1e-10)
+
+    assert result.converged
+    assert abs(f(result.root)) < 1e-10
+
+    result = solve(method='illinois', f=f, a=0.0, b=100.0, max_iter=20)
+
+    assert not result.converged
+
+def test_illinois_steep_bracket_end():
+    f = lambda x: math.exp(x) - 1e6
+
+    result = illinois_method(f, a=-50.0, b=50.0)
+
+    assert result.converged
+    assert math.isclose(result.root, math.log(1e6), rel_tol=1e-8)
+    assert result.b_final - result.a_final <= 2e-8
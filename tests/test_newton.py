@@ -1,5 +1,7 @@
 import math
-from methods.newton import newton_method
+import pytest
+from methods import _autodiff
+from methods.newton import newton_fixed_method, newton_method
 
 def test_newton_sqrt2():
     f = lambda x: x**2 - 2
@@ -17,4 +19,90 @@ def test_newton_nonconvergence():
 
     result = newton_method(f, df, x0=0.0, max_iter=5)
 
-    assert not result.converged
\ No newline at end of file
+    assert not result.converged
+
+def test_newton_jitted_matches_python():
+    numba = pytest.importorskip("numba")
+    f = lambda x: x**2 - 2
+    df = lambda x: 2 * x
+
+    expected = newton_method(f, df, x0=1.5)
+    result = newton_method(numba.njit(f), numba.njit(df), x0=1.5)
+
+    assert result.converged
+    assert result.iterations == expected.iterations
+    assert math.isclose(result.root, expected.root, rel_tol=1e-15)
+
+def test_newton_fused_f_and_df():
+    f = lambda x: x**2 - 2
+    df = lambda x: 2 * x
+
+    expected = newton_method(f, df, x0=1.5)
+    result = newton_method(f, None, x0=1.5, f_and_df=lambda x: (x * x - 2, 2 * x))
+
+    assert result.converged
+    assert result.iterations == expected.iterations
+    assert math.isclose(result.root, expected.root, rel_tol=1e-15)
+
+def test_newton_derives_df_when_missing(monkeypatch):
+    # Central-difference fallback, whether or not JAX is installed
+    monkeypatch.setattr(_autodiff, "_import_jax", lambda: None)
+
+    result = newton_method(lambda x: x**2 - 2, None, x0=1.5, tol=1e-10)
+
+    assert result.converged
+    assert math.isclose(result.root, math.sqrt(2), rel_tol=1e-10)
+
+def test_newton_derives_df_with_jax():
+    pytest.importorskip("jax")
+
+    result = newton_method(lambda x: x**2 - 2, None, x0=1.5, tol=1e-12)
+    expected = newton_method(lambda x: x**2 - 2, lambda x: 2 * x, x0=1.5, tol=1e-12)
+
+    assert result.converged
+    assert result.root == expected.root
+
+    # math.* cannot be traced by JAX: falls back to central differences
+    result = newton_method(lambda x: math.cos(x) - x, None, x0=1.0, tol=1e-12)
+    assert result.converged
+    assert math.isclose(result.root, 0.7390851332151607, rel_tol=1e-12)
+
+def test_jax_derivative_is_compiled_once_per_function():
+    pytest.importorskip("jax")
+    import gc
+    cached = len(_autodiff._JAX_CACHE)
+    f = lambda x: x**2 - 2
+
+    f_and_df = _autodiff.make_f_and_df(f)
+
+    assert _autodiff.make_f_and_df(f) is f_and_df
+    assert f_and_df(1.5) == (0.25, 3.0)
+
+    # The cache does not keep f alive
+    del f
+    gc.collect()
+    assert len(_autodiff._JAX_CACHE) == cached
+
+def test_newton_fixed_iterations():
+    f = lambda x: x**2 - 2
+    df = lambda x: 2 * x
+
+    result = newton_fixed_method(f, df, x0=1.5, n_iter=6)
+
+    assert result.iterations == 6
+    assert len(result.history) == 7
+    assert result.converged
+    assert math.isclose(result.root, math.sqrt(2), rel_tol=1e-15)
+
+def test_kernels_are_not_disk_cached():
+    # The kernels are specialised per user function; an on-disk index would
+    # pickle those functions' types and break in processes that cannot import them
+    pytest.importorskip("numba")
+    from numba.core.caching import NullCache
+    from methods.bisection import _bisection_core_jit
+    from methods.brent import _brent_core_jit
+    from methods.newton import _newton_core_jit
+    from methods.secant import _secant_core_jit
+
+    for kernel in (_bisection_core_jit, _brent_core_jit, _newton_core_jit, _secant_core_jit):
+        assert isinstance(kernel._cache, NullCache)
@@ -0,0 +1,38 @@
+import math
+import pytest
+
+from methods.newton import newton_method
+from methods.newton_bisect import newton_bisect_method
+from methods.solver import solve
+
+def test_newton_bisect_sqrt2():
+    f = lambda x: x**2 - 2
+    df = lambda x: 2 * x
+
+    result = solve(method='newton_bisect', f=f, df=df, a=1.0, b=2.0, tol=1e-10)
+
+    assert result.converged
+    assert math.isclose(result.root, math.sqrt(2), rel_tol=1e-10)
+    assert result.a_final <= result.root <= result.b_final
+
+def test_newton_bisect_where_newton_diverges():
+    # Newton overshoots on atan from |x0| > ~1.39; the bracket keeps it safe
+    f = math.atan
+    df = lambda x: 1.0 / (1.0 + x * x)
+
+    assert not newton_method(f, df, x0=3.0).converged
+
+    result = newton_bisect_method(f, df, a=-2.0, b=20.0)
+
+    assert result.converged
+    assert abs(result.root) < 1e-8
+
+def test_newton_bisect_requires_bracket():
+    with pytest.raises(ValueError):
+        newton_bisect_method(lambda x: x**2 + 1, lambda x: 2 * x, a=1.0, b=2.0)
+
+def test_newton_bisect_exact_midpoint_with_no_iterations():
+    result = newton_bisect_method(lambda x: x - 1.5, lambda x: 1.0, a=1.0, b=2.0, max_iter=0)
+
+    assert result.converged
+    assert result.root == 1.5
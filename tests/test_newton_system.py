@@ -1,7 +1,8 @@
 # tests/test_newton_system.py
+import pytest
 import numpy as np
 
-from methods.newton_system import newton_system
+from methods.newton_system import _factorize, finite_difference_jacobian, newton_system
 from methods.solver import solve_system
 
 def test_newton_system_converges_with_analytic_jacobian():
@@ -55,3 +56,140 @@ def test_solve_system_newton():
     res = solve_system("newton", F, x0=[0.8, 0.6], jac=J)
     assert res.converged
     assert np.linalg.norm(F(res.root)) < 1e-10
+
+
+def test_newton_system_fused_fjac():
+    calls = []
+
+    def FJ(v):
+        calls.append(1)
+        x, y = v
+        fx = np.array([x*x + y*y - 1.0, x - y])
+        J = np.array([[2.0*x, 2.0*y],
+                      [1.0, -1.0]])
+        return fx, J
+
+    res = newton_system(None, x0=[0.8, 0.6], fjac=FJ, tol_f=1e-12, max_iter=50)
+    assert res.converged
+    assert np.allclose(res.root, np.sqrt(0.5), atol=1e-9)
+    # One fused call per accepted point (no line-search backtracks needed here)
+    assert len(calls) == res.iterations + 1
+
+
+def test_newton_system_fd_switch_saves_evaluations():
+    calls = []
+
+    def F(v: np.ndarray) -> np.ndarray:
+        calls.append(1)
+        x, y = v
+        return np.array([x*x + y*y - 1.0, x - y])
+
+    res = newton_system(F, x0=[0.8, 0.6], tol_f=1e-10, max_iter=80)
+    n_switch = len(calls)
+    calls.clear()
+    ref = newton_system(F, x0=[0.8, 0.6], tol_f=1e-10, max_iter=80, fd_switch_tol=None)
+    n_central = len(calls)
+
+    assert res.converged and ref.converged
+    assert np.linalg.norm(F(res.root)) < 1e-8
+    assert n_switch < n_central
+
+
+def test_fd_jacobian_batched_matches_loop():
+    def F(v: np.ndarray) -> np.ndarray:
+        x, y, z = v
+        return np.array([x*y - z, np.sin(x) + z*z, x + y + z])
+
+    def F_batched(V: np.ndarray) -> np.ndarray:
+        x, y, z = V.T
+        return np.stack([x*y - z, np.sin(x) + z*z, x + y + z], axis=1)
+
+    x = np.array([0.3, -1.2, 2.0])
+    for method in ("forward", "central"):
+        J_loop = finite_difference_jacobian(F, x, method=method)
+        J_batch = finite_difference_jacobian(F, x, method=method, F_batched=F_batched)
+        assert np.allclose(J_batch, J_loop, rtol=1e-12, atol=1e-12)
+
+
+def test_newton_system_lazy_jacobian_refresh():
+    jac_calls = []
+
+    def F(v: np.ndarray) -> np.ndarray:
+        x, y = v
+        return np.array([x*x + y*y - 1.0, x - y])
+
+    def J(v: np.ndarray) -> np.ndarray:
+        jac_calls.append(1)
+        x, y = v
+        return np.array([[2.0*x, 2.0*y],
+                         [1.0, -1.0]])
+
+    res = newton_system(F, x0=[0.8, 0.6], jac=J, tol_f=1e-12, max_iter=50, jac_refresh=3)
+    assert res.converged
+    assert np.linalg.norm(F(res.root)) < 1e-12
+    assert len(jac_calls) < res.iterations
+
+
+def test_newton_system_does_not_modify_x0():
+    def F(v: np.ndarray) -> np.ndarray:
+        x, y = v
+        return np.array([x*x + y*y - 1.0, x - y])
+
+    x0 = np.array([0.8, 0.6])
+    res = newton_system(F, x0=x0, tol_f=1e-10)
+
+    assert res.converged
+    assert np.array_equal(x0, [0.8, 0.6])
+
+
+def test_newton_system_out_mode():
+    def F(v: np.ndarray, out: np.ndarray) -> None:
+        x, y = v
+        out[0] = x*x + y*y - 1.0
+        out[1] = x - y
+
+    def J(v: np.ndarray, out: np.ndarray) -> None:
+        x, y = v
+        out[0, 0] = 2.0*x
+        out[0, 1] = 2.0*y
+        out[1, 0] = 1.0
+        out[1, 1] = -1.0
+
+    res = newton_system(F, x0=[0.8, 0.6], jac=J, tol_f=1e-12, out_mode=True)
+    assert res.converged
+    assert np.allclose(res.root, np.sqrt(0.5), atol=1e-12)
+
+    res_fd = newton_system(F, x0=[0.8, 0.6], tol_f=1e-10, out_mode=True)
+    assert res_fd.converged
+    assert np.allclose(res_fd.root, np.sqrt(0.5), atol=1e-9)
+
+def test_small_jacobian_solve_matches_numpy():
+    rng = np.random.default_rng(0)
+    for n in (2, 3, 4):
+        J = rng.normal(size=(n, n)) + n * np.eye(n)
+        rhs = rng.normal(size=n)
+        np.testing.assert_allclose(_factorize(J)(rhs), np.linalg.solve(J, rhs), rtol=1e-12)
+
+    # Singular 2x2: falls back to least squares instead of dividing by det = 0
+    J = np.array([[1.0, 2.0], [2.0, 4.0]])
+    rhs = np.array([1.0, 2.0])
+    np.testing.assert_allclose(_factorize(J)(rhs), np.linalg.lstsq(J, rhs, rcond=None)[0])
+
+@pytest.mark.parametrize("F_s,J_s,x0", [
+    (lambda x, y: (x * x + y * y - 1.0, x - y),
+     lambda x, y: ((2 * x, 2 * y), (1.0, -1.0)),
+     (0.8, 0.6)),
+    (lambda x, y, z: (x * x + y * y + z * z - 3.0, x - y, y * z - 1.0),
+     lambda x, y, z: ((2 * x, 2 * y, 2 * z), (1.0, -1.0, 0.0), (0.0, z, y)),
+     (0.8, 0.6, 1.5)),
+])
+def test_newton_system_scalar_backend_matches_numpy(F_s, J_s, x0):
+    F = lambda v: np.array(F_s(*v))
+    J = lambda v: np.array(J_s(*v))
+
+    expected = newton_system(F, x0=list(x0), jac=J)
+    for jac in (J_s, None):
+        res = newton_system(F_s, x0=x0, jac=jac, backend="scalar")
+        assert res.converged
+        assert res.iterations == expected.iterations
+        np.testing.assert_allclose(res.root, expected.root, rtol=1e-12)
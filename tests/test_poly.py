@@ -0,0 +1,47 @@
+import math
+
+import numpy as np
+import pytest
+
+from methods.poly import horner_string, make_poly_root_kernel, poly_derivative, poly_newton
+
+def test_horner_string_matches_polyval():
+    coeffs = [2.0, -3.0, 0.0, 5.0, -1.5]
+    expr = horner_string(coeffs)
+
+    for x in (-2.0, 0.3, 1.7):
+        assert math.isclose(eval(expr, {"x": x}), np.polyval(coeffs, x), rel_tol=1e-14)
+    assert "**" not in expr
+    assert poly_derivative(coeffs) == [8.0, -9.0, 0.0, 5.0]
+
+def test_poly_newton_sqrt2():
+    result = poly_newton([1.0, 0.0, -2.0], x0=1.5)
+
+    assert result.converged
+    assert math.isclose(result.root, math.sqrt(2), rel_tol=1e-8)
+
+def test_poly_kernel_cubic_brent():
+    # (x - 1)(x - 2)(x - 3) = x^3 - 6x^2 + 11x - 6
+    brent = make_poly_root_kernel([1.0, -6.0, 11.0, -6.0], "brent")
+    result = brent(a=2.5, b=4.0)
+
+    assert result.converged
+    assert abs(result.root - 3.0) < 1e-8
+
+def test_poly_kernel_rejects_constant():
+    with pytest.raises(ValueError):
+        make_poly_root_kernel([0.0, 3.0])
+
+def test_poly_newton_aot_matches_jit():
+    aot = pytest.importorskip("methods._solver_aot")
+    coeffs = [1.0, -6.0, 11.0, -6.0]
+
+    expected = make_poly_root_kernel(coeffs, "newton")(3.6, tol=1e-12)
+    root, k, converged = aot.poly_newton_f8(
+        np.array(coeffs), np.array(poly_derivative(coeffs)), 3.6, 1e-12, 50, 1e-12, np.empty(51)
+    )
+
+    assert converged
+    assert k == expected.iterations
+    assert root == expected.root
+    assert poly_newton(coeffs, 3.6, tol=1e-12).root == expected.root
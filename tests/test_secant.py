@@ -1,4 +1,5 @@
 import math
+import pytest
 
 from methods.secant import secant_method
 
@@ -9,4 +10,15 @@ def test_secant_sqrt2():
 
     assert result.converged
     assert math.isclose(result.root, math.sqrt(2), rel_tol=1e-10, abs_tol=0.0)
-    assert result.iterations > 0
\ No newline at end of file
+    assert result.iterations > 0
+
+def test_secant_jitted_matches_python():
+    numba = pytest.importorskip("numba")
+    f = lambda x: x**2 - 2
+
+    expected = secant_method(f, x0=1.0, x1=2.0, tol=1e-10, max_iter=100)
+    result = secant_method(numba.njit(f), x0=1.0, x1=2.0, tol=1e-10, max_iter=100)
+
+    assert result.converged
+    assert result.iterations == expected.iterations
+    assert math.isclose(result.root, expected.root, rel_tol=1e-15)
@@ -1,39 +1,211 @@
 import math
-from methods.solver import solve
+import numpy as np
+from methods.solver import solve, solve_batch, solve_sweep
 import pytest
 
-def test_solve_newton():
-    f = lambda x: x**2 - 2
-    df = lambda x: 2 * x
+# Shared by the scalar tests, so every test passes the same function objects
+def _f_sqrt2(x):
+    return x * x - 2.0
 
-    result = solve(method='newton', f=f, df=df, x0=1.5)
+def _df_sqrt2(x):
+    return 2.0 * x
 
-    assert result.converged
-    assert math.isclose(result.root, math.sqrt(2), rel_tol=1e-8)
-
-def test_solve_bisection():
-    f = lambda x: x**2 - 2
+_SQRT2 = math.sqrt(2)
 
-    result = solve(method='bisection', f=f, a=1.0, b=2.0)
-
-    assert result.converged
-    assert math.isclose(result.root, math.sqrt(2), rel_tol=1e-8)
+_P = 2.0
 
-def test_solve_secant():
-    f = lambda x: x**2 - 2
+def _f_param(x):
+    return x * x - _P
 
-    result = solve(method='secant', f=f, x0=1.0, x1=2.0)
+@pytest.mark.parametrize("method,kwargs", [
+    ('newton', {'df': _df_sqrt2, 'x0': 1.5}),
+    ('newton4', {'df': _df_sqrt2, 'x0': 1.5}),
+    ('newton_fixed', {'df': _df_sqrt2, 'x0': 1.5}),
+    ('halley', {'df': _df_sqrt2, 'd2f': lambda x: 2.0, 'x0': 1.5}),
+    ('secant', {'x0': 1.0, 'x1': 2.0}),
+    ('bisection', {'a': 1.0, 'b': 2.0}),
+    ('illinois', {'a': 1.0, 'b': 2.0}),
+    ('brent', {'a': 1.0, 'b': 2.0}),
+    ('newton_bisect', {'df': _df_sqrt2, 'a': 1.0, 'b': 2.0}),
+])
+def test_solve(method, kwargs):
+    result = solve(method=method, f=_f_sqrt2, **kwargs)
 
     assert result.converged
-    assert math.isclose(result.root, math.sqrt(2), rel_tol=1e-8)
+    assert math.isclose(result.root, _SQRT2, rel_tol=1e-8)
 
 def test_secant_missing_args():
-    f = lambda x: x**2 - 2
+    f = _f_sqrt2
 
     with pytest.raises(ValueError):
         solve(method='secant', f=f, x0=1.0)  # Missing x1
 
 def test_solve_invalid_method():
-    f = lambda x: x**2 - 2
+    f = _f_sqrt2
+    with pytest.raises(ValueError):
+        solve(method='invalid_method', f=f)
+
+def test_solve_newton_autodiff(monkeypatch):
+    from methods import _autodiff
+    monkeypatch.setattr(_autodiff, "_import_jax", lambda: None)
+    f = _f_sqrt2
+
+    with pytest.raises(ValueError, match=r"df \(or autodiff=True\) and x0"):
+        solve(method='newton', f=f, x0=1.5)
+
+    result = solve(method='newton', f=f, x0=1.5, autodiff=True)
+
+    assert result.converged
+    assert math.isclose(result.root, _SQRT2, rel_tol=1e-8)
+
+@pytest.mark.parametrize("method,kwargs", [
+    ('newton4', {'x0': 1.5}),
+    ('newton_fixed', {'x0': 1.5}),
+    ('halley', {'d2f': lambda x: 2.0, 'x0': 1.5}),
+    ('newton_bisect', {'a': 1.0, 'b': 2.0}),
+])
+def test_solve_autodiff_is_newton_only(method, kwargs):
+    with pytest.raises(ValueError, match="requires df"):
+        solve(method=method, f=_f_sqrt2, autodiff=True, **kwargs)
+
+def test_solve_vectorized():
+    k = np.array([2.0, 3.0, 5.0])
+
+    result = solve(method='bisection', f=lambda x: x**2 - k, a=np.zeros(3), b=k, vectorized=True)
+
+    assert result.converged.all()
+    assert np.allclose(result.root, np.sqrt(k), atol=1e-8)
+
+@pytest.mark.parametrize("kwargs", [
+    {'jit': True},
+    {'autodiff': True},
+    {'d2f': lambda x: 2.0},
+    {'backend': 'c'},
+    {'backend': 'bogus'},
+])
+def test_solve_vectorized_rejects_unsupported_options(kwargs):
+    k = np.array([2.0, 3.0, 5.0])
+
+    with pytest.raises(ValueError):
+        solve(method='bisection', f=lambda x: x**2 - k, a=np.zeros(3), b=k, vectorized=True, **kwargs)
+
+def test_solve_jit_matches_python():
+    pytest.importorskip("numba")
+    f, df = _f_sqrt2, _df_sqrt2
+
+    for kwargs in (dict(method='newton', df=df, x0=1.5), dict(method='brent', a=1.0, b=2.0)):
+        expected = solve(f=f, **kwargs)
+        result = solve(f=f, jit=True, **kwargs)
+
+        assert result.root == expected.root
+        assert result.iterations == expected.iterations
+
+def test_solve_newton_fixed_step_count():
+    assert solve(method='newton_fixed', f=_f_sqrt2, df=_df_sqrt2, x0=1.5).iterations == 6
+    assert solve(method='newton_fixed', f=_f_sqrt2, df=_df_sqrt2, x0=1.5, max_iter=3).iterations == 3
+
+def test_solve_newton4():
+    f, df = _f_sqrt2, _df_sqrt2
+
+    newton = solve(method='newton', f=f, df=df, x0=1.5, tol=1e-12)
+    result = solve(method='newton4', f=f, df=df, x0=1.5, tol=1e-12)
+
+    assert result.converged
+    assert math.isclose(result.root, _SQRT2, rel_tol=1e-12)
+    assert result.iterations <= newton.iterations // 2
+
+def test_solve_batch_newton():
+    k = np.arange(1, 8, dtype=float)
+
+    result = solve_batch(method='newton', f=lambda x: x**2 - k, df=lambda x: 2 * x, x0=np.full_like(k, 1.5))
+
+    assert result.converged.all()
+    assert np.allclose(result.root, np.sqrt(k))
+
+def test_solve_halley():
+    newton = solve(method='newton', f=_f_sqrt2, df=_df_sqrt2, x0=1.5)
+    result = solve(method='halley', f=_f_sqrt2, df=_df_sqrt2, d2f=lambda x: 2.0, x0=1.5)
+
+    assert result.converged
+    assert math.isclose(result.root, _SQRT2, rel_tol=1e-8)
+    assert result.iterations < newton.iterations
+
+def test_solve_ftol_stops_early():
+    plain = solve(method='bisection', f=_f_sqrt2, a=1.0, b=2.0)
+    result = solve(method='bisection', f=_f_sqrt2, a=1.0, b=2.0, ftol=1e-3)
+
+    assert result.converged
+    assert abs(_f_sqrt2(result.root)) < 1e-3
+    assert result.iterations < plain.iterations
+
+def test_solve_ftol_both_secant_guesses_inside_band():
+    # Both residuals snap to 0.0: x1 is an exact zero, not a flat secant
+    result = solve(method='secant', f=_f_sqrt2, x0=1.4142, x1=1.4143, ftol=1e-3)
+
+    assert result.converged
+    assert result.iterations == 0
+    assert result.root == 1.4143
+
+def test_solve_vectorized_ftol():
+    k = np.array([2.0, 3.0, 5.0])
+    kwargs = dict(method='bisection', f=lambda x: x**2 - k, a=np.zeros(3), b=k, vectorized=True)
+
+    plain = solve(**kwargs)
+    result = solve(ftol=1e-3, **kwargs)
+
+    assert result.converged.all()
+    assert np.all(np.abs(result.root**2 - k) <= 1e-3)
+    assert np.all(result.iterations < plain.iterations)
+
     with pytest.raises(ValueError):
-        solve(method='invalid_method', f=f)
\ No newline at end of file
+        solve(method='newton', f=lambda x: x**2 - k, df=lambda x: 2 * x, x0=k, vectorized=True, ftol=1e-3)
+
+def test_solve_jit_ftol_reuses_snapped_function():
+    numba = pytest.importorskip("numba")
+    from methods.solver import _snap_to_zero
+
+    f = numba.njit(_f_sqrt2)
+    assert _snap_to_zero(f, 1e-3) is _snap_to_zero(f, 1e-3)
+    assert _snap_to_zero(f, 1e-3) is not _snap_to_zero(f, 1e-4)
+
+    result = solve(method='brent', f=_f_sqrt2, a=1.0, b=2.0, jit=True, ftol=1e-3)
+    assert abs(_f_sqrt2(result.root)) < 1e-3
+
+def test_solve_jit_rejects_uncompilable_function():
+    pytest.importorskip("numba")
+    # Calls a plain Python function, which Numba cannot type
+    f = lambda x: _f_sqrt2(x)
+
+    with pytest.raises(ValueError, match="jit=True"):
+        solve(method='newton', f=f, df=_df_sqrt2, x0=1.5, jit=True)
+
+    assert solve(method='newton', f=f, df=_df_sqrt2, x0=1.5).converged
+
+def test_solve_jit_sees_changed_globals(monkeypatch):
+    # Numba freezes globals at compile time: jit=True must not reuse stale code
+    pytest.importorskip("numba")
+
+    for p in (2.0, 3.0):
+        monkeypatch.setitem(globals(), "_P", p)
+        result = solve(method='newton', f=_f_param, df=_df_sqrt2, x0=1.5, jit=True)
+
+        assert math.isclose(result.root, math.sqrt(p), rel_tol=1e-8)
+
+def test_solve_sweep_warm_start():
+    params = np.linspace(2.0, 3.0, 21)
+    calls = {"warm": 0, "cold": 0}
+
+    def factory(kind):
+        def make(p):
+            def f(x):
+                calls[kind] += 1
+                return x * x - p
+            return f, lambda x: 2.0 * x
+        return make
+
+    roots = solve_sweep('newton', factory("warm"), params, x0=100.0, tol=1e-12)
+    for p in params:
+        solve('newton', *factory("cold")(p), x0=100.0, tol=1e-12)
+
+    assert np.allclose(roots, np.sqrt(params), rtol=1e-12)
+    assert calls["warm"] < calls["cold"] / 2